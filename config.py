@@ -4,7 +4,7 @@ Configuration for Obsidian note management system
 """
 
 import os
-from pathlib import Path
+import functools
 
 # 옵시디언 볼트 기본 경로 (메모리 정보 기반)
 # Default Obsidian vault path (based on memory information)
@@ -33,20 +33,25 @@ BACKUP_DIR = os.path.join(os.getcwd(), "backups")
 LOG_LEVEL = "INFO"
 LOG_FILE = "obsidian_manager.log"
 
+# 경로 확인 결과는 프로세스 수명 동안 캐시됨 (stat 호출 1회)
+# Path check results are cached for the process lifetime (one stat call)
+@functools.lru_cache(maxsize=None)
 def get_vault_path():
-    """볼트 경로 반환 (존재 여부 확인)"""
-    """Return vault path (check if exists)"""
-    vault_path = Path(OBSIDIAN_VAULT_PATH)
-    if vault_path.exists():
-        return str(vault_path)
+    """볼트 경로 반환 (존재 여부 확인, 결과 캐시)"""
+    """Return vault path (check if exists, result cached)"""
+    # os.access(F_OK)는 Path.exists()의 stat보다 가벼운 존재 확인
+    # os.access(F_OK) is a lighter existence probe than Path.exists()'s stat
+    if os.access(OBSIDIAN_VAULT_PATH, os.F_OK):
+        return OBSIDIAN_VAULT_PATH
     else:
         print(f"⚠️  볼트 경로를 찾을 수 없습니다: {OBSIDIAN_VAULT_PATH}")
         print(f"⚠️  Vault path not found: {OBSIDIAN_VAULT_PATH}")
         return None
 
+@functools.lru_cache(maxsize=None)
 def get_para_folder_path(folder_type):
-    """PARA 폴더 경로 반환"""
-    """Return PARA folder path"""
+    """PARA 폴더 경로 반환 (결과 캐시)"""
+    """Return PARA folder path (result cached)"""
     vault_path = get_vault_path()
     if vault_path and folder_type in PARA_FOLDERS:
         return os.path.join(vault_path, PARA_FOLDERS[folder_type])
@@ -8,17 +8,12 @@ import click
 import logging
 import signal
 import sys
-from rich.console import Console
-from rich.table import Table
 from pathlib import Path
 
 from config import get_vault_path, PARA_FOLDERS, LOG_FILE, LOG_LEVEL
-from obsidian_manager import ObsidianManager
-from vault_tree_manager import VaultTreeManager
 
-# 콘솔 및 로깅 설정
-# Console and logging setup
-console = Console()
+# 로깅 설정
+# Logging setup
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL),
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -28,15 +23,51 @@ logging.basicConfig(
     ]
 )
 
+# 무거운 모듈(rich, 매니저 클래스)은 명령 실행 시점에 지연 로드
+# Heavy modules (rich, manager classes) are lazy-loaded at command dispatch
+_console = None
+
+def get_console():
+    """Rich 콘솔 지연 생성 (콜드 스타트 단축)"""
+    """Lazily create the Rich console (faster cold start)"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
 # 전역 변수로 트리 매니저 저장
 # Store tree manager as global variable
 tree_manager = None
 
+# 상태별 표시 문자열 (행마다 dict를 새로 만들지 않도록 모듈 상수로)
+# Status display strings (module constant to avoid per-row dict builds)
+STATUS_EMOJI_CLI = {
+    'success': '✅ SUCCESS',
+    'error': '❌ ERROR',
+    'warning': '⚠️ WARNING'
+}
+
+# 활동 요약에서 표시할 키
+# Summary keys shown in the activity table
+SUMMARY_DISPLAY_KEYS = ('total_notes', 'processed_notes', 'note_count')
+
+def _format_summary(summary):
+    """활동 요약을 한 줄 문자열로 변환"""
+    """Format an activity summary as a one-line string"""
+    summary_text = [f"{key}: {summary[key]}" for key in SUMMARY_DISPLAY_KEYS if key in summary]
+
+    summary_str = ", ".join(summary_text[:3])  # 최대 3개 항목만
+    if len(summary_str) > 50:
+        summary_str = summary_str[:50] + "..."
+    return summary_str
+
 def signal_handler(sig, frame):
     """시그널 핸들러 - 프로그램 종료 시 감시 중지"""
     """Signal handler - stop monitoring when program exits"""
     global tree_manager
     if tree_manager and tree_manager.is_watching:
+        console = get_console()
         console.print("\n🛑 [yellow]프로그램 종료 중... 볼트 감시를 중지합니다.[/yellow]")
         console.print("🛑 [yellow]Exiting program... Stopping vault monitoring.[/yellow]")
         tree_manager.stop_watching()
@@ -49,51 +80,74 @@ signal.signal(signal.SIGTERM, signal_handler)
 
 @click.group()
 @click.version_option(version='1.0.0')
-def cli():
+@click.pass_context
+def cli(ctx):
     """옵시디언 노트 관리 시스템"""
     """Obsidian Note Management System"""
-    pass
+    # 명령 간에 공유되는 매니저 저장소
+    # Storage for the manager shared across commands
+    ctx.ensure_object(dict)
+    ctx.obj.setdefault('manager', None)
+
+def get_manager(ctx):
+    """
+    공유 ObsidianManager 반환 (프로세스당 한 번만 생성)
+    Return the shared ObsidianManager (constructed once per process)
+    """
+    if ctx.obj.get('manager') is None:
+        vault_path = get_vault_path()
+        if not vault_path:
+            return None
+
+        from obsidian_manager import ObsidianManager
+        ctx.obj['manager'] = ObsidianManager(vault_path)
+
+    return ctx.obj['manager']
 
 @cli.command()
-def status():
+@click.pass_context
+def status(ctx):
     """볼트 상태 확인"""
     """Check vault status"""
+    console = get_console()
     console.print("🔍 [bold blue]옵시디언 볼트 상태 확인 중...[/bold blue]")
     console.print("🔍 [bold blue]Checking Obsidian vault status...[/bold blue]")
-    
-    vault_path = get_vault_path()
-    if not vault_path:
+
+    manager = get_manager(ctx)
+    if not manager:
         console.print("❌ [bold red]볼트를 찾을 수 없습니다![/bold red]")
         console.print("❌ [bold red]Vault not found![/bold red]")
         return
-    
-    manager = ObsidianManager(vault_path)
+
+    from rich.table import Table
+
     status_info = manager.get_vault_status()
-    
+
     # 상태 테이블 생성
     # Create status table
     table = Table(title="📊 Obsidian Vault Status")
     table.add_column("항목 / Item", style="cyan")
     table.add_column("값 / Value", style="green")
-    
-    table.add_row("볼트 경로 / Vault Path", vault_path)
+
+    table.add_row("볼트 경로 / Vault Path", str(manager.vault_path))
     table.add_row("총 노트 수 / Total Notes", str(status_info['total_notes']))
     table.add_row("PARA 폴더 수 / PARA Folders", str(status_info['para_folders']))
     
     console.print(table)
 
 @cli.command()
-def organize():
+@click.pass_context
+def organize(ctx):
     """노트 정리 실행"""
     """Execute note organization"""
+    console = get_console()
     console.print("🧹 [bold green]노트 정리를 시작합니다...[/bold green]")
     console.print("🧹 [bold green]Starting note organization...[/bold green]")
-    
-    vault_path = get_vault_path()
-    if not vault_path:
+
+    manager = get_manager(ctx)
+    if not manager:
         return
-    
-    manager = ObsidianManager(vault_path)
+
     result = manager.organize_notes()
     
     if result['success']:
@@ -104,17 +158,18 @@ def organize():
         console.print(f"❌ [bold red]Organization failed: {result['error']}[/bold red]")
 
 @cli.command()
-def backup():
+@click.pass_context
+def backup(ctx):
     """노트 백업 생성"""
     """Create note backup"""
+    console = get_console()
     console.print("💾 [bold yellow]백업을 생성합니다...[/bold yellow]")
     console.print("💾 [bold yellow]Creating backup...[/bold yellow]")
-    
-    vault_path = get_vault_path()
-    if not vault_path:
+
+    manager = get_manager(ctx)
+    if not manager:
         return
-    
-    manager = ObsidianManager(vault_path)
+
     backup_path = manager.create_backup()
     
     if backup_path:
@@ -127,19 +182,22 @@ def backup():
 @cli.command()
 @click.option('--folder', type=click.Choice(['projects', 'areas', 'resources', 'archive']), 
               help='특정 PARA 폴더만 분석 / Analyze specific PARA folder only')
-def analyze(folder):
+@click.pass_context
+def analyze(ctx, folder):
     """노트 분석 실행"""
     """Execute note analysis"""
+    console = get_console()
     console.print("📈 [bold magenta]노트 분석을 시작합니다...[/bold magenta]")
     console.print("📈 [bold magenta]Starting note analysis...[/bold magenta]")
-    
-    vault_path = get_vault_path()
-    if not vault_path:
+
+    manager = get_manager(ctx)
+    if not manager:
         return
-    
-    manager = ObsidianManager(vault_path)
+
+    from rich.table import Table
+
     analysis = manager.analyze_notes(folder)
-    
+
     # 분석 결과 표시
     # Display analysis results
     table = Table(title="📊 Note Analysis Results")
@@ -153,19 +211,22 @@ def analyze(folder):
 
 @cli.command()
 @click.option('--limit', default=10, help='표시할 최근 활동 수 / Number of recent activities to show')
-def logs(limit):
+@click.pass_context
+def logs(ctx, limit):
     """관리 작업 로그 조회"""
     """View management activity logs"""
+    console = get_console()
     console.print("📋 [bold blue]관리 작업 이력을 조회합니다...[/bold blue]")
     console.print("📋 [bold blue]Retrieving management activity history...[/bold blue]")
-    
-    vault_path = get_vault_path()
-    if not vault_path:
+
+    manager = get_manager(ctx)
+    if not manager:
         return
-    
-    manager = ObsidianManager(vault_path)
+
+    from rich.table import Table
+
     summary = manager.get_management_summary()
-    
+
     # 최근 활동 테이블 생성
     # Create recent activities table
     table = Table(title=f"📝 최근 {limit}개 관리 활동 / Recent {limit} Management Activities")
@@ -175,34 +236,22 @@ def logs(limit):
     table.add_column("요약 / Summary", style="white")
     
     recent_activities = summary['recent_activities'][-limit:]
-    
-    for activity in reversed(recent_activities):
-        # 상태 이모지
-        # Status emoji
-        status_emoji = {
-            'success': '✅ SUCCESS',
-            'error': '❌ ERROR',
-            'warning': '⚠️ WARNING'
-        }.get(activity['status'], '📝 INFO')
-        
-        # 요약 정보를 간단히 표시
-        # Display summary briefly
-        summary_text = []
-        for key, value in activity['summary'].items():
-            if key in ['total_notes', 'processed_notes', 'note_count']:
-                summary_text.append(f"{key}: {value}")
-        
-        summary_str = ", ".join(summary_text[:3])  # 최대 3개 항목만
-        if len(summary_str) > 50:
-            summary_str = summary_str[:50] + "..."
-        
-        table.add_row(
+
+    # 행 데이터를 한 번에 구성한 뒤 테이블에 추가
+    # Compose all row data at once, then add to the table
+    rows = [
+        (
             activity['timestamp'],
             activity['command'].upper(),
-            status_emoji,
-            summary_str
+            STATUS_EMOJI_CLI.get(activity['status'], '📝 INFO'),
+            _format_summary(activity['summary'])
         )
-    
+        for activity in reversed(recent_activities)
+    ]
+
+    for row in rows:
+        table.add_row(*row)
+
     console.print(table)
     
     # 로그 파일 경로 안내
@@ -211,31 +260,33 @@ def logs(limit):
 
 @cli.command()
 @click.option('--output', help='출력 파일 경로 / Output file path')
-def report(output):
+@click.pass_context
+def report(ctx, output):
     """관리 리포트 생성"""
     """Generate management report"""
+    console = get_console()
     console.print("📊 [bold blue]관리 리포트를 생성합니다...[/bold blue]")
     console.print("📊 [bold blue]Generating management report...[/bold blue]")
-    
-    vault_path = get_vault_path()
-    if not vault_path:
+
+    manager = get_manager(ctx)
+    if not manager:
         return
-    
-    manager = ObsidianManager(vault_path)
+
     report_path = manager.management_logger.export_report(output)
     
     console.print(f"✅ [bold green]리포트 생성 완료: {report_path}[/bold green]")
     console.print(f"✅ [bold green]Report generated: {report_path}[/bold green]")
 
 @cli.command()
-def open_logs():
+@click.pass_context
+def open_logs(ctx):
     """관리 로그 파일 열기"""
     """Open management log file"""
-    vault_path = get_vault_path()
-    if not vault_path:
+    console = get_console()
+    manager = get_manager(ctx)
+    if not manager:
         return
-    
-    manager = ObsidianManager(vault_path)
+
     log_path = manager.management_logger.markdown_log
     
     if log_path.exists():
@@ -260,13 +311,16 @@ def open_logs():
 def update_tree():
     """볼트 트리 구조 수동 업데이트"""
     """Manually update vault tree structure"""
+    console = get_console()
     console.print("🌳 [bold green]볼트 트리 구조를 업데이트합니다...[/bold green]")
     console.print("🌳 [bold green]Updating vault tree structure...[/bold green]")
-    
+
     vault_path = get_vault_path()
     if not vault_path:
         return
-    
+
+    from vault_tree_manager import VaultTreeManager
+
     try:
         tree_manager = VaultTreeManager(vault_path)
         tree_manager.update_tree_structure()
@@ -284,15 +338,18 @@ def update_tree():
 def watch_vault():
     """볼트 실시간 감시 시작"""
     """Start real-time vault monitoring"""
+    console = get_console()
     console.print("👁️ [bold green]볼트 실시간 감시를 시작합니다...[/bold green]")
     console.print("👁️ [bold green]Starting real-time vault monitoring...[/bold green]")
-    
+
     vault_path = get_vault_path()
     if not vault_path:
         return
-    
+
+    from vault_tree_manager import VaultTreeManager
+
     global tree_manager
-    
+
     try:
         tree_manager = VaultTreeManager(vault_path)
         tree_manager.start_watching()
@@ -323,6 +380,7 @@ def watch_vault():
 def stop_watch():
     """볼트 실시간 감시 중지"""
     """Stop real-time vault monitoring"""
+    console = get_console()
     console.print("🛑 [bold yellow]볼트 실시간 감시를 중지합니다...[/bold yellow]")
     console.print("🛑 [bold yellow]Stopping real-time vault monitoring...[/bold yellow]")
     
@@ -340,17 +398,21 @@ def stop_watch():
 def tree_status():
     """트리 구조 감시 상태 확인"""
     """Check tree structure monitoring status"""
+    console = get_console()
     console.print("📊 [bold blue]트리 구조 감시 상태를 확인합니다...[/bold blue]")
     console.print("📊 [bold blue]Checking tree structure monitoring status...[/bold blue]")
-    
+
     vault_path = get_vault_path()
     if not vault_path:
         return
-    
+
+    from rich.table import Table
+    from vault_tree_manager import VaultTreeManager
+
     try:
         tree_manager = VaultTreeManager(vault_path)
         status = tree_manager.get_status()
-        
+
         # 상태 테이블 생성
         # Create status table
         table = Table(title="🌳 Tree Structure Monitoring Status")
@@ -378,10 +440,13 @@ def tree_status():
 def open_tree():
     """볼트 트리 구조 파일 열기"""
     """Open vault tree structure file"""
+    console = get_console()
     vault_path = get_vault_path()
     if not vault_path:
         return
-    
+
+    from vault_tree_manager import VaultTreeManager
+
     tree_manager = VaultTreeManager(vault_path)
     tree_file = tree_manager.tree_file
     
@@ -409,9 +474,9 @@ if __name__ == '__main__':
     try:
         cli()
     except KeyboardInterrupt:
-        console.print("\n👋 [bold yellow]프로그램이 중단되었습니다.[/bold yellow]")
-        console.print("\n👋 [bold yellow]Program interrupted.[/bold yellow]")
+        get_console().print("\n👋 [bold yellow]프로그램이 중단되었습니다.[/bold yellow]")
+        get_console().print("\n👋 [bold yellow]Program interrupted.[/bold yellow]")
     except Exception as e:
-        console.print(f"\n❌ [bold red]오류 발생: {str(e)}[/bold red]")
-        console.print(f"\n❌ [bold red]Error occurred: {str(e)}[/bold red]")
+        get_console().print(f"\n❌ [bold red]오류 발생: {str(e)}[/bold red]")
+        get_console().print(f"\n❌ [bold red]Error occurred: {str(e)}[/bold red]")
         logging.error(f"Unexpected error: {str(e)}", exc_info=True) 
\ No newline at end of file
@@ -5,11 +5,47 @@ Obsidian Management Activity Logger
 
 import os
 import json
+import atexit
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 
+# 메모리에 유지할 최근 로그 항목 수
+# Number of recent log entries kept in memory
+MAX_LOG_ENTRIES = 100
+
+# 로그 파일이 캐시 크기의 몇 배를 넘으면 압축할지
+# Compact the log file when it exceeds this multiple of the cache size
+JSONL_COMPACT_FACTOR = 10
+
+# 몇 개 항목마다 마크다운 로그를 디스크에 기록할지
+# How many entries between markdown log flushes
+MD_FLUSH_THRESHOLD = 20
+
+# 몇 개 항목마다 통계 블록을 다시 쓸지
+# How many entries between stats block rewrites
+STATS_FLUSH_EVERY = 10
+
+# 상태별 이모지 매핑
+# Status emoji mapping
+STATUS_EMOJI = {
+    'success': '✅',
+    'error': '❌',
+    'warning': '⚠️',
+    'info': 'ℹ️'
+}
+
+# 마크다운 통계 블록 구분 마커
+# Sentinel markers delimiting the markdown statistics block
+STATS_START_MARKER = '<!--STATS:START-->'
+STATS_END_MARKER = '<!--STATS:END-->'
+
+# 통계 블록에 예약된 고정 크기 (바이트) — 공백으로 패딩하여 제자리 덮어쓰기
+# Fixed size reserved for the stats block (bytes) — space-padded for in-place overwrite
+STATS_BLOCK_CAPACITY = 4096
+
 @dataclass
 class LogEntry:
     """로그 엔트리 데이터 클래스"""
@@ -39,43 +75,166 @@ class ManagementLogger:
         # 마크다운 로그 파일 경로
         # Markdown log file paths
         self.markdown_log = self.log_dir / "obsidian_management_history.md"
-        self.json_log = self.log_dir / "management_activities.json"
+        self.json_log = self.log_dir / "management_activities.jsonl"
+
+        # 구버전 JSON 배열 형식에서 JSONL로 마이그레이션
+        # Migrate from legacy JSON array format to JSONL
+        legacy_json = self.log_dir / "management_activities.json"
+        if not self.json_log.exists() and legacy_json.exists():
+            self._migrate_legacy_json(legacy_json)
         
         # 첫 실행 시 마크다운 로그 파일 초기화
         # Initialize markdown log file on first run
         if not self.markdown_log.exists():
             self._initialize_markdown_log()
+
+        # JSONL 로그 꼬리를 한 번만 읽어 메모리 캐시로 유지 (최근 100개)
+        # Load JSONL log tail once into an in-memory cache (last 100 entries)
+        self._logs = deque(maxlen=MAX_LOG_ENTRIES)
+        self._jsonl_line_count = 0
+        self._load_jsonl_log()
+
+        # 로그당 한 번의 산술 연산으로 유지되는 누적 통계
+        # Running aggregates maintained with one arithmetic step per log
+        self._stats = {
+            'total': 0,
+            'success': 0,
+            'dur_sum': 0.0,
+            'dur_n': 0,
+            'cmd_counts': {},
+            'last': '-'
+        }
+        for entry in self._logs:
+            self._accumulate_stats(entry)
+
+        # 마크다운 엔트리 쓰기 버퍼 (배치 기록)
+        # Markdown entry write buffer (batched writes)
+        self._md_buffer = []
+
+        # 통계 블록의 바이트 오프셋/용량 (첫 갱신 시 파일에서 탐색)
+        # Byte offset/capacity of the stats block (located on first update)
+        self._stats_offset = None
+        self._stats_capacity = 0
+
+        # 마지막 통계 기록 이후 쌓인 엔트리 수
+        # Entries accumulated since the last stats write
+        self._stats_dirty_count = 0
+
+        # 마지막으로 기록한 통계 블록의 메모리 사본
+        # In-memory copy of the last written stats block
+        self._last_stats_block = None
+
+        # 프로세스 종료 시 버퍼에 남은 엔트리 기록
+        # Flush buffered entries on process exit
+        atexit.register(self._flush_markdown)
+
+    def _accumulate_stats(self, entry: Dict):
+        """
+        누적 통계에 로그 엔트리 반영
+        Fold a log entry into the running aggregates
+        """
+        self._stats['total'] += 1
+        if entry.get('status') == 'success':
+            self._stats['success'] += 1
+        if entry.get('duration') is not None:
+            self._stats['dur_sum'] += entry['duration']
+            self._stats['dur_n'] += 1
+        cmd = entry.get('command', '')
+        self._stats['cmd_counts'][cmd] = self._stats['cmd_counts'].get(cmd, 0) + 1
+        self._stats['last'] = entry.get('timestamp', '-')
+
+    def _migrate_legacy_json(self, legacy_json: Path):
+        """
+        구버전 JSON 배열 파일을 JSONL 형식으로 변환
+        Convert legacy JSON array file to JSONL format
+        """
+        try:
+            with open(legacy_json, 'r', encoding='utf-8') as f:
+                logs = json.load(f)
+        except:
+            return
+
+        with open(self.json_log, 'w', encoding='utf-8') as f:
+            for entry in logs:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def _load_jsonl_log(self):
+        """
+        JSONL 로그 파일의 꼬리 부분 읽기
+        Read the tail of the JSONL log file
+        """
+        if not self.json_log.exists():
+            return
+
+        try:
+            with open(self.json_log, 'r', encoding='utf-8') as f:
+                # deque(maxlen)으로 마지막 항목들만 유지
+                # deque(maxlen) keeps only the last entries
+                tail = deque(maxlen=MAX_LOG_ENTRIES)
+                for line in f:
+                    self._jsonl_line_count += 1
+                    tail.append(line)
+                for line in tail:
+                    line = line.strip()
+                    if line:
+                        self._logs.append(json.loads(line))
+        except:
+            pass
+
+    def _compact_jsonl(self):
+        """
+        JSONL 파일을 메모리 캐시 내용으로 압축 (원자적 교체)
+        Compact the JSONL file down to the in-memory cache (atomic replace)
+        """
+        tmp_path = self.json_log.with_suffix('.jsonl.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in self._logs:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        os.replace(tmp_path, self.json_log)
+
+        self._jsonl_line_count = len(self._logs)
     
     def _initialize_markdown_log(self):
         """
-        마크다운 로그 파일 초기화
-        Initialize markdown log file
+        마크다운 로그 파일 초기화 (고정 크기 통계 블록 예약)
+        Initialize markdown log file (reserve fixed-size stats block)
         """
-        initial_content = f"""# 🧠 Obsidian 관리 작업 이력
+        header = f"""# 🧠 Obsidian 관리 작업 이력
 # Obsidian Management Activity History
 
-> 자동 생성된 관리 작업 이력입니다. 수동으로 편집하지 마세요.  
+> 자동 생성된 관리 작업 이력입니다. 수동으로 편집하지 마세요.
 > Auto-generated management activity history. Do not edit manually.
 
-**생성 일시**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
+**생성 일시**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 **Creation Time**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 ---
 
+"""
+        initial_stats = """
 ## 📊 요약 통계 / Summary Statistics
 
 - **총 실행 횟수**: 0
 - **마지막 실행**: -
 - **Total Executions**: 0
 - **Last Execution**: -
+"""
+        footer = """
 
 ---
 
 ## 📝 상세 이력 / Detailed History
 
 """
-        with open(self.markdown_log, 'w', encoding='utf-8') as f:
-            f.write(initial_content)
+        # 통계 블록을 공백으로 패딩하여 고정 크기로 예약
+        # Pad the stats block with spaces to reserve a fixed size
+        block = initial_stats.encode('utf-8').ljust(STATS_BLOCK_CAPACITY, b' ')
+        content = (header.encode('utf-8') +
+                   STATS_START_MARKER.encode('utf-8') + block +
+                   STATS_END_MARKER.encode('utf-8') + footer.encode('utf-8'))
+
+        with open(self.markdown_log, 'wb') as f:
+            f.write(content)
     
     def log_activity(self, command: str, status: str, summary: Dict[str, Any], 
                     duration: Optional[float] = None, error: Optional[str] = None):
@@ -106,107 +265,115 @@ class ManagementLogger:
         # JSON 로그에 추가
         # Add to JSON log
         self._append_json_log(log_entry)
-        
-        # 마크다운 로그에 추가
-        # Add to markdown log
+
+        # 마크다운 로그 버퍼에 추가 (배치 기록)
+        # Buffer for markdown log (batched write)
+        self._stats_dirty_count += 1
         self._append_markdown_log(log_entry)
-        
-        # 통계 업데이트
-        # Update statistics
-        self._update_statistics()
+
+        # 통계 블록은 일정 개수마다 (또는 오류 시 즉시) 다시 쓰기
+        # Rewrite the stats block every few entries (or immediately on error)
+        if self._stats_dirty_count >= STATS_FLUSH_EVERY or status == 'error':
+            self._flush_statistics()
     
     def _append_json_log(self, log_entry: LogEntry):
         """
-        JSON 로그 파일에 엔트리 추가
-        Append entry to JSON log file
+        JSONL 로그 파일에 엔트리 한 줄 추가 (O(1) 쓰기)
+        Append one line to the JSONL log file (O(1) write)
         """
-        logs = []
-        
-        # 기존 로그 읽기
-        # Read existing logs
-        if self.json_log.exists():
-            try:
-                with open(self.json_log, 'r', encoding='utf-8') as f:
-                    logs = json.load(f)
-            except:
-                logs = []
-        
-        # 새 엔트리 추가
-        # Add new entry
-        logs.append(asdict(log_entry))
-        
-        # 최근 100개 항목만 유지
-        # Keep only last 100 entries
-        if len(logs) > 100:
-            logs = logs[-100:]
-        
-        # 파일에 저장
-        # Save to file
-        with open(self.json_log, 'w', encoding='utf-8') as f:
-            json.dump(logs, f, indent=2, ensure_ascii=False)
+        entry = asdict(log_entry)
+
+        # deque가 최근 100개 항목 유지를 처리
+        # The deque handles keeping only the last 100 entries
+        self._logs.append(entry)
+        self._accumulate_stats(entry)
+
+        # 한 줄만 추가 — 이력 길이와 무관하게 일정한 비용
+        # Append a single line — constant cost regardless of history length
+        with open(self.json_log, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._jsonl_line_count += 1
+
+        # 파일이 캐시 크기의 10배를 넘으면 압축
+        # Compact when the file grows past 10x the cache size
+        if self._jsonl_line_count > MAX_LOG_ENTRIES * JSONL_COMPACT_FACTOR:
+            self._compact_jsonl()
     
     def _append_markdown_log(self, log_entry: LogEntry):
         """
         마크다운 로그 파일에 엔트리 추가
         Append entry to markdown log file
         """
-        # 상태 이모지 매핑
-        # Status emoji mapping
-        status_emoji = {
-            'success': '✅',
-            'error': '❌',
-            'warning': '⚠️',
-            'info': 'ℹ️'
-        }
-        
-        emoji = status_emoji.get(log_entry.status, '📝')
-        
-        # 마크다운 엔트리 생성
-        # Create markdown entry
-        entry_md = f"""### {emoji} {log_entry.command.upper()} - {log_entry.timestamp}
+        emoji = STATUS_EMOJI.get(log_entry.status, '📝')
+
+        # 엔트리 조각을 모아 마지막에 한 번만 결합 (문자열 += 재할당 회피)
+        # Collect entry parts and join once (avoids string += reallocation)
+        dumps = json.dumps
+        parts = [f"""### {emoji} {log_entry.command.upper()} - {log_entry.timestamp}
 
-**상태 / Status**: {log_entry.status.upper()}  
-**실행 시간 / Duration**: {log_entry.duration:.2f}초 / {log_entry.duration:.2f}s  
+**상태 / Status**: {log_entry.status.upper()}
+**실행 시간 / Duration**: {log_entry.duration:.2f}초 / {log_entry.duration:.2f}s
 
 **결과 요약 / Summary**:
-"""
-        
-        # 요약 정보 추가
-        # Add summary information
-        for key, value in log_entry.summary.items():
-            if isinstance(value, dict):
-                entry_md += f"- **{key}**: {json.dumps(value, ensure_ascii=False)}\n"
-            else:
-                entry_md += f"- **{key}**: {value}\n"
-        
+"""]
+
+        # 요약 정보 추가 (dict 값은 한 번만 직렬화)
+        # Add summary information (dict values serialized once)
+        parts.extend(
+            f"- **{key}**: {dumps(value, ensure_ascii=False) if isinstance(value, dict) else value}\n"
+            for key, value in log_entry.summary.items()
+        )
+
         # 오류 정보 추가
         # Add error information if exists
         if log_entry.error:
-            entry_md += f"\n**오류 / Error**: `{log_entry.error}`\n"
-        
-        entry_md += "\n---\n\n"
-        
-        # 파일에 추가
-        # Append to file
-        with open(self.markdown_log, 'a', encoding='utf-8') as f:
-            f.write(entry_md)
+            parts.append(f"\n**오류 / Error**: `{log_entry.error}`\n")
+
+        parts.append("\n---\n\n")
+        entry_md = ''.join(parts)
+
+        # 버퍼에 추가 — 임계치 도달 또는 오류 발생 시 즉시 기록
+        # Buffer the entry — flush at threshold or immediately on error
+        self._md_buffer.append(entry_md)
+        if len(self._md_buffer) >= MD_FLUSH_THRESHOLD or log_entry.status == 'error':
+            self._flush_markdown()
+
+    def _flush_markdown(self):
+        """
+        버퍼된 마크다운 엔트리를 한 번에 기록하고 통계 갱신
+        Write buffered markdown entries in one batch and refresh statistics
+        """
+        if not self._md_buffer:
+            return
+
+        # 파일을 한 번만 열어 버퍼 전체 기록
+        # Open the file once and write the whole buffer
+        with open(self.markdown_log, 'a', encoding='utf-8', buffering=1 << 16) as f:
+            f.writelines(self._md_buffer)
+        self._md_buffer.clear()
+
+        # 아직 반영되지 않은 통계가 있으면 함께 갱신
+        # Refresh the stats block too if it has pending updates
+        self._flush_statistics()
+
+    def _flush_statistics(self):
+        """
+        쌓인 변경이 있을 때만 통계 블록 다시 쓰기
+        Rewrite the stats block only when changes have accumulated
+        """
+        if self._stats_dirty_count == 0:
+            return
+
+        self._update_statistics()
+        self._stats_dirty_count = 0
     
-    def _update_statistics(self):
+    def _format_stats_section(self) -> str:
         """
-        마크다운 파일의 통계 섹션 업데이트
-        Update statistics section in markdown file
+        통계 블록 마크다운 생성
+        Build the statistics block markdown
         """
-        # JSON 로그에서 통계 계산
-        # Calculate statistics from JSON log
         stats = self._calculate_statistics()
-        
-        # 마크다운 파일 읽기
-        # Read markdown file
-        with open(self.markdown_log, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # 통계 섹션 교체
-        # Replace statistics section
+
         stats_section = f"""## 📊 요약 통계 / Summary Statistics
 
 - **총 실행 횟수**: {stats['total_executions']}
@@ -220,22 +387,96 @@ class ManagementLogger:
 
 **명령어별 실행 횟수 / Command Execution Count**:
 """
-        
+
         for cmd, count in stats['command_counts'].items():
             stats_section += f"- **{cmd}**: {count}회 / {count} times\n"
-        
-        stats_section += "\n---\n\n## 📝 상세 이력 / Detailed History\n\n"
-        
-        # 통계 섹션 교체
-        # Replace statistics section
-        import re
-        pattern = r'## 📊 요약 통계.*?## 📝 상세 이력 / Detailed History\n\n'
-        content = re.sub(pattern, stats_section, content, flags=re.DOTALL)
-        
-        # 파일에 저장
-        # Save to file
-        with open(self.markdown_log, 'w', encoding='utf-8') as f:
-            f.write(content)
+
+        return stats_section
+
+    def _locate_stats_block(self):
+        """
+        파일에서 통계 블록의 오프셋/용량 탐색 (한 번만 수행)
+        Locate the stats block offset/capacity in the file (done once)
+        """
+        data = self.markdown_log.read_bytes()
+        start_marker = STATS_START_MARKER.encode('utf-8')
+        end_marker = STATS_END_MARKER.encode('utf-8')
+
+        start = data.find(start_marker)
+        if start == -1:
+            return
+
+        end = data.find(end_marker, start)
+        if end == -1:
+            return
+
+        self._stats_offset = start + len(start_marker)
+        self._stats_capacity = end - self._stats_offset
+
+    def _rebuild_stats_block(self, block: bytes):
+        """
+        통계 블록을 새 용량으로 재배치 (전체 파일 재작성 — 드문 경우)
+        Relocate the stats block with a new capacity (full rewrite — rare)
+        """
+        data = self.markdown_log.read_bytes()
+        start_marker = STATS_START_MARKER.encode('utf-8')
+        end_marker = STATS_END_MARKER.encode('utf-8')
+
+        capacity = max(STATS_BLOCK_CAPACITY, len(block) * 2)
+        padded = block.ljust(capacity, b' ')
+
+        start = data.find(start_marker)
+        if start != -1:
+            end = data.find(end_marker, start)
+            if end == -1:
+                return
+            data = (data[:start + len(start_marker)] + padded + data[end:])
+        else:
+            # 마커가 없는 구버전 파일: 제목 기준으로 위치를 찾아 마커 삽입
+            # Legacy file without markers: locate by headings and insert markers
+            head = data.find('## 📊 요약 통계'.encode('utf-8'))
+            tail = data.find('## 📝 상세 이력 / Detailed History'.encode('utf-8'))
+            if head == -1 or tail == -1:
+                return
+            data = (data[:head] + start_marker + padded + end_marker +
+                    '\n\n---\n\n'.encode('utf-8') + data[tail:])
+            start = head
+
+        with open(self.markdown_log, 'wb') as f:
+            f.write(data)
+
+        self._stats_offset = start + len(start_marker)
+        self._stats_capacity = capacity
+        self._last_stats_block = padded
+
+    def _update_statistics(self):
+        """
+        예약된 통계 블록을 제자리에서 덮어쓰기 (전체 파일 읽기/쓰기 없음)
+        Overwrite the reserved stats block in place (no full-file read/write)
+        """
+        block = ('\n' + self._format_stats_section()).encode('utf-8')
+
+        if self._stats_offset is None:
+            self._locate_stats_block()
+
+        # 블록이 용량을 초과하거나 마커가 없으면 재배치
+        # Relocate if the block outgrows its capacity or markers are missing
+        if self._stats_offset is None or len(block) > self._stats_capacity:
+            self._rebuild_stats_block(block)
+            return
+
+        # 메모리 사본과 동일하면 디스크 쓰기 생략
+        # Skip the disk write if identical to the in-memory copy
+        padded = block.ljust(self._stats_capacity, b' ')
+        if padded == self._last_stats_block:
+            return
+
+        # 고정 크기로 패딩 후 해당 오프셋만 덮어쓰기
+        # Pad to the fixed size and overwrite only that offset
+        with open(self.markdown_log, 'r+b') as f:
+            f.seek(self._stats_offset)
+            f.write(padded)
+        self._last_stats_block = padded
     
     def _calculate_statistics(self) -> Dict[str, Any]:
         """
@@ -245,50 +486,18 @@ class ManagementLogger:
         Returns:
             Dict: 통계 정보 / Statistics information
         """
-        stats = {
-            'total_executions': 0,
-            'last_execution': '-',
-            'success_rate': 0.0,
-            'avg_duration': 0.0,
-            'command_counts': {}
+        # 누적 통계에서 O(1)로 도출 (전체 로그 재계산 없음)
+        # Derived in O(1) from running aggregates (no full-log recompute)
+        s = self._stats
+        total = s['total']
+
+        return {
+            'total_executions': total,
+            'last_execution': s['last'],
+            'success_rate': (s['success'] / total) * 100 if total else 0.0,
+            'avg_duration': s['dur_sum'] / s['dur_n'] if s['dur_n'] else 0.0,
+            'command_counts': dict(s['cmd_counts'])
         }
-        
-        if not self.json_log.exists():
-            return stats
-        
-        try:
-            with open(self.json_log, 'r', encoding='utf-8') as f:
-                logs = json.load(f)
-            
-            if not logs:
-                return stats
-            
-            # 기본 통계
-            # Basic statistics
-            stats['total_executions'] = len(logs)
-            stats['last_execution'] = logs[-1]['timestamp']
-            
-            # 성공률
-            # Success rate
-            success_count = sum(1 for log in logs if log['status'] == 'success')
-            stats['success_rate'] = (success_count / len(logs)) * 100
-            
-            # 평균 실행 시간
-            # Average duration
-            durations = [log['duration'] for log in logs if log['duration'] is not None]
-            if durations:
-                stats['avg_duration'] = sum(durations) / len(durations)
-            
-            # 명령어별 횟수
-            # Command counts
-            for log in logs:
-                cmd = log['command']
-                stats['command_counts'][cmd] = stats['command_counts'].get(cmd, 0) + 1
-            
-        except Exception as e:
-            print(f"통계 계산 중 오류: {e}")
-        
-        return stats
     
     def get_recent_activities(self, limit: int = 10) -> List[Dict]:
         """
@@ -301,15 +510,23 @@ class ManagementLogger:
         Returns:
             List[Dict]: 최근 활동 목록 / Recent activities list
         """
+        # 캐시 범위 내면 메모리에서 바로 반환 (디스크 읽기 없음)
+        # Within the cache window, return from memory (no disk read)
+        if limit <= MAX_LOG_ENTRIES:
+            logs = list(self._logs)
+            return logs[-limit:] if logs else []
+
+        # 캐시보다 긴 요청은 JSONL 꼬리만 스트리밍으로 읽기
+        # For longer requests, stream only the JSONL tail
         if not self.json_log.exists():
-            return []
-        
+            return list(self._logs)
+
         try:
             with open(self.json_log, 'r', encoding='utf-8') as f:
-                logs = json.load(f)
-            return logs[-limit:] if logs else []
+                tail = deque(f, maxlen=limit)
+            return [json.loads(line) for line in tail if line.strip()]
         except:
-            return []
+            return list(self._logs)
     
     def export_report(self, output_path: Optional[str] = None) -> str:
         """
@@ -356,7 +573,7 @@ class ManagementLogger:
 """
         
         for activity in reversed(recent_activities):
-            status_emoji = {'success': '✅', 'error': '❌', 'warning': '⚠️'}.get(activity['status'], '📝')
+            status_emoji = STATUS_EMOJI.get(activity['status'], '📝')
             report_content += f"- {status_emoji} **{activity['command']}** - {activity['timestamp']}\n"
         
         # 파일에 저장
@@ -4,19 +4,89 @@ Core class for Obsidian note management
 """
 
 import os
+import re
 import shutil
 import json
+import atexit
 import logging
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
-import frontmatter
-import markdown
 from config import PARA_FOLDERS, BACKUP_DIR, SUPPORTED_EXTENSIONS
 from management_log import ManagementLogger
 
+# str.endswith는 튜플 인자를 받아 C 레벨에서 확장자를 검사
+# str.endswith accepts a tuple and checks extensions at C level
+_SUPPORTED_EXT_TUPLE = tuple(SUPPORTED_EXTENSIONS)
+
+# 모듈 로드 시 한 번만 컴파일되는 정규식 패턴
+# Regex patterns compiled once at module load
+_ANY_LINK_RE = re.compile(r'\[\[([^\]]+)\]\]|\[([^\]]+)\]\([^)]+\)')
+_HEADING_RE = re.compile(r'^#+\s+(.+)$', re.MULTILINE)
+
+# 링크/헤딩을 본문 1회 스캔으로 함께 추출하는 결합 패턴
+# Combined pattern extracting links and headings in one content scan
+_NOTE_SCAN_RE = re.compile(
+    r'\[\[(?P<wiki>[^\]]+)\]\]'
+    r'|\[(?P<mdlink>[^\]]+)\]\([^)]+\)'
+    r'|^#+\s+(?P<heading>.+)$',
+    re.MULTILINE
+)
+
+# 단어 경계 패턴 (부분 문자열 리스트를 만들지 않고 개수만 셈)
+# Word pattern (counts words without building a substring list)
+_WORD_RE = re.compile(r'\S+')
+
+# frontmatter는 처음 필요할 때만 로드 (status/backup 등에서는 불필요)
+# frontmatter loads only when first needed (status/backup etc. don't use it)
+_frontmatter = None
+
+def _get_frontmatter():
+    """frontmatter 모듈 지연 로드"""
+    """Lazily load the frontmatter module"""
+    global _frontmatter
+    if _frontmatter is None:
+        import frontmatter as _frontmatter_module
+        _frontmatter = _frontmatter_module
+    return _frontmatter
+
+# 순회에서 제외되는 디렉토리 (플러그인 캐시, VCS, 휴지통 등)
+# Directories excluded from walks (plugin caches, VCS, trash etc.)
+_EXCLUDE_DIRS = frozenset({'.obsidian', '.git', '.trash', 'node_modules'})
+
+def _iter_files(root, exclude_dirs=_EXCLUDE_DIRS, exts=None):
+    """
+    os.scandir 기반 재귀 파일 순회 (DirEntry의 stat 캐시 활용)
+    Recursive file walk based on os.scandir (reuses DirEntry's cached stat)
+
+    Args:
+        root: 순회 시작 디렉토리 / Directory to start walking from
+        exclude_dirs: 하위 탐색에서 제외할 디렉토리 이름 집합
+                      / Directory names pruned from recursion
+        exts: 반환할 파일 확장자 튜플 (None이면 전체)
+              / Tuple of file extensions to yield (all files when None)
+
+    Yields:
+        os.DirEntry: 파일 엔트리 / File entries
+    """
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in exclude_dirs:
+                        yield from _iter_files(entry.path, exclude_dirs, exts)
+                elif entry.is_file(follow_symlinks=False):
+                    if exts is None or entry.name.endswith(exts):
+                        yield entry
+    except OSError:
+        # 순회 중 사라졌거나 접근 불가한 디렉토리는 건너뜀
+        # Skip directories that vanished or are inaccessible mid-walk
+        pass
+
 class ObsidianManager:
     """옵시디언 볼트 관리 클래스"""
     """Obsidian vault management class"""
@@ -38,8 +108,57 @@ class ObsidianManager:
         
         if not self.vault_path.exists():
             raise ValueError(f"볼트 경로를 찾을 수 없습니다: {vault_path}")
-            
+
+        # 노트 분석 결과 캐시: 경로 → (mtime_ns, size, 분석 결과)
+        # Note analysis cache: path -> (mtime_ns, size, analysis result)
+        self._analysis_cache: Dict[str, tuple] = {}
+        self._analysis_cache_file = Path(BACKUP_DIR) / '.analysis_cache.json'
+        self._analysis_cache_dirty = False
+        self._load_analysis_cache()
+
+        # 노트 목록 캐시: (폴더, 루트 mtime_ns) → 목록 (CLI 세션 내 재사용)
+        # Notes-list cache: (folder, root mtime_ns) -> list (reused within a CLI session)
+        self._notes_list_cache: Dict[tuple, List[Path]] = {}
+
+        # 프로세스 종료 시 캐시 저장
+        # Save the cache on process exit
+        atexit.register(self._save_analysis_cache)
+
         self.logger.info(f"ObsidianManager 초기화 완료: {vault_path}")
+
+    def _load_analysis_cache(self):
+        """분석 캐시 파일 읽기"""
+        """Load the analysis cache file"""
+        try:
+            with open(self._analysis_cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            self._analysis_cache = {
+                path: (entry[0], entry[1], entry[2]) for path, entry in cached.items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError, IndexError):
+            # 손상되었거나 형식이 다른 캐시 파일은 무시하고 빈 캐시로 시작
+            # — 캐시 때문에 앱이 기동 불능이 되어서는 안 됨
+            # A corrupt or wrong-shaped cache file is ignored and we start
+            # with an empty cache — a cache must never brick the app
+            self._analysis_cache = {}
+
+    def _save_analysis_cache(self):
+        """분석 캐시 파일 저장 (변경이 있을 때만)"""
+        """Save the analysis cache file (only when changed)"""
+        if not self._analysis_cache_dirty:
+            return
+
+        try:
+            os.makedirs(BACKUP_DIR, exist_ok=True)
+            tmp_path = self._analysis_cache_file.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                # frontmatter 날짜 등 JSON이 모르는 타입은 문자열로 저장
+                # Types JSON doesn't know (frontmatter dates etc.) stored as strings
+                json.dump(self._analysis_cache, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, self._analysis_cache_file)
+            self._analysis_cache_dirty = False
+        except OSError:
+            pass
     
     def get_vault_status(self) -> Dict:
         """
@@ -58,32 +177,46 @@ class ObsidianManager:
                 'last_modified': None,
                 'folder_stats': {}
             }
-            
-            # 전체 마크다운 파일 수 계산
-            # Count total markdown files
-            for ext in SUPPORTED_EXTENSIONS:
-                status['total_notes'] += len(list(self.vault_path.rglob(f'*{ext}')))
-            
-            # PARA 폴더 존재 여부 확인
-            # Check PARA folder existence
+
+            # PARA 폴더 경로 접두사 → 폴더 키 매핑
+            # Map PARA folder path prefixes to folder keys
+            folder_prefixes = {
+                str(self.vault_path / folder_name) + os.sep: folder_key
+                for folder_key, folder_name in PARA_FOLDERS.items()
+            }
+
+            # 단일 scandir 순회로 전체/폴더별 노트 수와 최근 수정 시간을 함께 집계
+            # Count total/per-folder notes and the latest mtime in a single scandir walk
+            folder_stats = {}
+            max_mtime_ns = 0
+            for entry in _iter_files(self.vault_path, exts=_SUPPORTED_EXT_TUPLE):
+                status['total_notes'] += 1
+
+                # DirEntry의 캐시된 stat 재사용 — 파일당 추가 syscall 없음
+                # Reuses DirEntry's cached stat — no extra syscall per file
+                mtime_ns = entry.stat(follow_symlinks=False).st_mtime_ns
+                if mtime_ns > max_mtime_ns:
+                    max_mtime_ns = mtime_ns
+
+                for prefix, folder_key in folder_prefixes.items():
+                    if entry.path.startswith(prefix):
+                        folder_stats[folder_key] = folder_stats.get(folder_key, 0) + 1
+                        break
+
+            # PARA 폴더 존재 여부 확인 (비어 있는 폴더도 집계)
+            # Check PARA folder existence (count empty folders too)
             for folder_key, folder_name in PARA_FOLDERS.items():
-                folder_path = self.vault_path / folder_name
-                if folder_path.exists():
+                if (self.vault_path / folder_name).is_dir():
                     status['para_folders'] += 1
-                    # 각 폴더별 노트 수 계산
-                    # Count notes in each folder
-                    folder_notes = 0
-                    for ext in SUPPORTED_EXTENSIONS:
-                        folder_notes += len(list(folder_path.rglob(f'*{ext}')))
-                    status['folder_stats'][folder_key] = folder_notes
-            
-            # 최근 수정 시간 확인
-            # Check last modification time
-            try:
+                    status['folder_stats'][folder_key] = folder_stats.get(folder_key, 0)
+            
+            # 최근 수정 시간: 순회 중 집계한 최대 노트 mtime 사용
+            # Last modification time: the max note mtime gathered during the walk
+            if max_mtime_ns:
                 status['last_modified'] = datetime.fromtimestamp(
-                    self.vault_path.stat().st_mtime
+                    max_mtime_ns / 1e9
                 ).isoformat()
-            except:
+            else:
                 status['last_modified'] = "Unknown"
             
             duration = time.time() - start_time
@@ -139,14 +272,31 @@ class ObsidianManager:
         else:
             search_path = self.vault_path
         
-        if not search_path.exists():
+        try:
+            root_mtime_ns = search_path.stat().st_mtime_ns
+        except OSError:
             self.logger.warning(f"검색 경로가 존재하지 않습니다: {search_path}")
             return notes
-        
-        for ext in SUPPORTED_EXTENSIONS:
-            notes.extend(search_path.rglob(f'*{ext}'))
-        
-        return sorted(notes)
+
+        # 같은 CLI 세션에서 같은 폴더를 다시 걷지 않도록 캐시
+        # Cache so the same CLI session doesn't re-walk the same folder
+        cache_key = (folder, root_mtime_ns)
+        cached = self._notes_list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # 단일 scandir 순회로 지원 확장자 파일 수집
+        # Collect supported files in a single scandir walk
+        notes = sorted(
+            Path(entry.path)
+            for entry in _iter_files(search_path, exts=_SUPPORTED_EXT_TUPLE)
+        )
+
+        if len(self._notes_list_cache) >= 4:
+            self._notes_list_cache.pop(next(iter(self._notes_list_cache)))
+        self._notes_list_cache[cache_key] = notes
+
+        return notes
     
     def analyze_note(self, note_path: Path) -> Dict:
         """
@@ -160,48 +310,81 @@ class ObsidianManager:
             Dict: 노트 분석 결과 / Note analysis results
         """
         try:
-            with open(note_path, 'r', encoding='utf-8') as f:
-                post = frontmatter.load(f)
-            
+            # 파일이 바뀌지 않았으면 캐시된 분석 결과 재사용
+            # Reuse the cached analysis if the file hasn't changed
+            stat = note_path.stat()
+            cache_key = str(note_path)
+            cached = self._analysis_cache.get(cache_key)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return cached[2]
+
+            # 파일을 한 번만 읽고, frontmatter가 없는 노트는 YAML 파서 생략
+            # Read the file once; skip the YAML parser for notes without frontmatter
+            raw = note_path.read_bytes().decode('utf-8', errors='replace')
+            if raw.startswith('---'):
+                post = _get_frontmatter().loads(raw)
+                metadata, content = post.metadata, post.content
+            else:
+                metadata, content = {}, raw
+
+            # 링크와 헤딩을 본문 1회 스캔으로 함께 추출
+            # Extract links and headings in a single content scan
+            links = []
+            headings = []
+            for match in _NOTE_SCAN_RE.finditer(content):
+                kind = match.lastgroup
+                if kind == 'heading':
+                    headings.append(match.group('heading'))
+                else:
+                    links.append(match.group(kind))
+
             analysis = {
                 'path': str(note_path),
-                'title': post.metadata.get('title', note_path.stem),
-                'tags': post.metadata.get('tags', []),
-                'created': post.metadata.get('created'),
-                'modified': post.metadata.get('modified'),
-                'word_count': len(post.content.split()),
-                'char_count': len(post.content),
-                'has_frontmatter': bool(post.metadata),
-                'links': self._extract_links(post.content),
-                'headings': self._extract_headings(post.content)
+                'title': metadata.get('title', note_path.stem),
+                'tags': metadata.get('tags', []),
+                'created': metadata.get('created'),
+                'modified': metadata.get('modified'),
+                'word_count': sum(1 for _ in _WORD_RE.finditer(content)),
+                'char_count': len(content),
+                'has_frontmatter': bool(metadata),
+                'links': links,
+                'headings': headings
             }
-            
+
+            self._analysis_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, analysis)
+            self._analysis_cache_dirty = True
+
             return analysis
             
         except Exception as e:
+            # 사라진 파일의 캐시 엔트리는 여기서 정리
+            # Stale cache entries for vanished files are dropped here
+            if self._analysis_cache.pop(str(note_path), None) is not None:
+                self._analysis_cache_dirty = True
             self.logger.error(f"노트 분석 실패 {note_path}: {str(e)}")
             return {'error': str(e), 'path': str(note_path)}
     
     def _extract_links(self, content: str) -> List[str]:
         """마크다운 링크 추출"""
         """Extract markdown links"""
-        import re
-        links = re.findall(r'\[\[([^\]]+)\]\]', content)  # Obsidian 링크
-        links.extend(re.findall(r'\[([^\]]+)\]\([^)]+\)', content))  # 마크다운 링크
-        return links
-    
+        # 결합 패턴으로 본문을 한 번만 스캔 (Obsidian + 마크다운 링크)
+        # One scan of the content with a combined pattern (Obsidian + markdown links)
+        return [a or b for a, b in _ANY_LINK_RE.findall(content)]
+
     def _extract_headings(self, content: str) -> List[str]:
         """마크다운 헤딩 추출"""
         """Extract markdown headings"""
-        import re
-        headings = re.findall(r'^#+\s+(.+)$', content, re.MULTILINE)
-        return headings
+        return _HEADING_RE.findall(content)
     
-    def organize_notes(self) -> Dict:
+    def organize_notes(self, notes: Optional[List[Path]] = None) -> Dict:
         """
         노트 정리 실행
         Execute note organization
-        
+
+        Args:
+            notes (List[Path], optional): 사전 수집된 노트 목록 (없으면 새로 수집)
+                                          / Pre-built notes list (collected if absent)
+
         Returns:
             Dict: 정리 결과 / Organization results
         """
@@ -217,7 +400,8 @@ class ObsidianManager:
                 'updated': []
             }
             
-            notes = self.get_notes_list()
+            if notes is None:
+                notes = self.get_notes_list()
             
             for note_path in notes:
                 try:
@@ -291,11 +475,13 @@ class ObsidianManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_name = f"obsidian_backup_{timestamp}"
             backup_path = os.path.join(BACKUP_DIR, backup_name)
-            
-            # 볼트 전체 복사
-            # Copy entire vault
-            shutil.copytree(self.vault_path, backup_path, 
-                           ignore=shutil.ignore_patterns('*.tmp', '.obsidian'))
+
+            # 증분 스냅샷: 변경 없는 파일은 이전 백업에서 하드링크로 연결
+            # Incremental snapshot: unchanged files hardlink to the previous backup
+            prev_snapshot, prev_files = self._load_backup_manifest()
+            new_files = self._snapshot_tree(str(self.vault_path), backup_path,
+                                            prev_snapshot, prev_files)
+            self._save_backup_manifest(backup_path, new_files)
             
             # 백업 정보 저장
             # Save backup info
@@ -307,8 +493,10 @@ class ObsidianManager:
                 'note_count': notes_count
             }
             
+            # 기계가 읽는 메타데이터라 들여쓰기 불필요 — 컴팩트 직렬화
+            # Machine-read metadata needs no indentation — compact serialization
             with open(os.path.join(backup_path, 'backup_info.json'), 'w', encoding='utf-8') as f:
-                json.dump(backup_info, f, indent=2, ensure_ascii=False)
+                f.write(json.dumps(backup_info, ensure_ascii=False, separators=(',', ':')))
             
             duration = time.time() - start_time
             
@@ -345,27 +533,110 @@ class ObsidianManager:
             self.logger.error(f"백업 생성 실패: {str(e)}")
             return None
     
-    def _get_directory_size(self, directory: str) -> int:
-        """디렉토리 크기 계산"""
-        """Calculate directory size"""
-        total_size = 0
+    def _load_backup_manifest(self) -> tuple:
+        """이전 백업 매니페스트 로드"""
+        """Load the previous backup manifest"""
+        manifest_file = os.path.join(BACKUP_DIR, '.manifest.json')
         try:
-            for dirpath, dirnames, filenames in os.walk(directory):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    if os.path.exists(filepath):
-                        total_size += os.path.getsize(filepath)
-        except Exception:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            snapshot = manifest.get('snapshot')
+            if snapshot and os.path.isdir(snapshot):
+                return snapshot, manifest.get('files', {})
+        except (OSError, ValueError):
             pass
-        return total_size
+        return None, {}
+
+    def _save_backup_manifest(self, snapshot: str, files: Dict) -> None:
+        """백업 매니페스트를 원자적으로 저장"""
+        """Save the backup manifest atomically"""
+        manifest_file = os.path.join(BACKUP_DIR, '.manifest.json')
+        tmp_file = manifest_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'snapshot': snapshot, 'files': files}, f, ensure_ascii=False)
+        os.replace(tmp_file, manifest_file)
+
+    def _snapshot_tree(self, src: str, dst: str, prev_snapshot: Optional[str],
+                       prev_files: Dict) -> Dict:
+        """
+        증분 스냅샷 생성 (rsync 스타일)
+        Create an incremental snapshot (rsync-style)
+
+        변경되지 않은 파일(mtime_ns, size 일치)은 이전 스냅샷에서 하드링크하고,
+        변경된 파일만 실제로 복사합니다. 하드링크 실패 시 복사로 대체합니다.
+        Unchanged files (matching mtime_ns, size) are hardlinked from the previous
+        snapshot; only changed files are actually copied. Falls back to copy when
+        hardlinking fails.
+        """
+        new_files = {}
+        os.makedirs(dst)
+        stack = [(src, dst, '')]
+        while stack:
+            src_dir, dst_dir, rel_dir = stack.pop()
+            try:
+                entries = os.scandir(src_dir)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                    # 심볼릭 링크는 기존 copytree(symlinks=False 기본값)처럼
+                    # 가리키는 내용을 따라 복사 — is_dir/is_file이 링크를 따라감
+                    # Symlinks are followed like the old copytree default
+                    # (symlinks=False) — is_dir/is_file resolve through the link
+                    if entry.is_dir():
+                        if entry.name == '.obsidian':
+                            continue
+                        child_dst = os.path.join(dst_dir, entry.name)
+                        os.mkdir(child_dst)
+                        stack.append((entry.path, child_dst, rel_path))
+                    elif entry.is_file():
+                        if entry.name.endswith('.tmp'):
+                            continue
+                        # 일반 파일은 DirEntry.stat()이 scandir 결과를 재사용
+                        # — 심볼릭 링크만 대상 stat을 위해 syscall 1회 추가
+                        # DirEntry.stat() reuses the scandir result for regular
+                        # files — only symlinks cost one extra syscall to stat
+                        # the target
+                        stat = entry.stat()
+                        sig = [stat.st_mtime_ns, stat.st_size]
+                        dst_file = os.path.join(dst_dir, entry.name)
+                        linked = False
+                        if prev_snapshot and prev_files.get(rel_path) == sig:
+                            try:
+                                os.link(os.path.join(prev_snapshot, rel_path), dst_file)
+                                linked = True
+                            except OSError:
+                                pass  # 다른 파일시스템 등 — 복사로 대체 / cross-device etc.
+                        if not linked:
+                            shutil.copy2(entry.path, dst_file)
+                        new_files[rel_path] = sig
+                    elif entry.is_symlink():
+                        # 깨진 링크 — 복사할 내용이 없으므로 제외하되 반드시 기록
+                        # Broken link — nothing to copy, but never drop silently
+                        self.logger.warning(
+                            f"깨진 심볼릭 링크를 백업에서 제외: {rel_path} / "
+                            f"Skipping broken symlink in backup: {rel_path}")
+        return new_files
+
+    def _get_directory_size(self, directory: str) -> int:
+        """디렉토리 크기 계산 (scandir의 캐시된 stat 사용)"""
+        """Calculate directory size (uses scandir's cached stat)"""
+        # DirEntry.stat()은 scandir 결과를 재사용 — 파일당 추가 syscall 없음
+        # DirEntry.stat() reuses the scandir result — no extra syscall per file
+        return sum(entry.stat(follow_symlinks=False).st_size
+                   for entry in _iter_files(directory))
     
-    def analyze_notes(self, folder: Optional[str] = None) -> Dict:
+    def analyze_notes(self, folder: Optional[str] = None,
+                      notes: Optional[List[Path]] = None) -> Dict:
         """
         노트 분석 실행
         Execute note analysis
         
         Args:
             folder (str, optional): 특정 폴더만 분석 / Analyze specific folder only
+            notes (List[Path], optional): 사전 수집된 노트 목록 (없으면 새로 수집)
+                                          / Pre-built notes list (collected if absent)
             
         Returns:
             Dict: 분석 결과 / Analysis results
@@ -373,7 +644,8 @@ class ObsidianManager:
         start_time = time.time()
         
         try:
-            notes = self.get_notes_list(folder)
+            if notes is None:
+                notes = self.get_notes_list(folder)
             
             analysis = {
                 'total_notes': len(notes),
@@ -382,27 +654,24 @@ class ObsidianManager:
                 'notes_with_tags': 0,
                 'notes_with_frontmatter': 0,
                 'average_word_count': 0,
-                'common_tags': {},
+                'common_tags': Counter(),
                 'folder_distribution': {},
                 'analysis_errors': 0
             }
             
-            for note_path in notes:
-                note_analysis = self.analyze_note(note_path)
-                
-                if 'error' not in note_analysis:
-                    analysis['total_words'] += note_analysis.get('word_count', 0)
-                    analysis['total_chars'] += note_analysis.get('char_count', 0)
-                    
-                    if note_analysis.get('tags'):
-                        analysis['notes_with_tags'] += 1
-                        for tag in note_analysis['tags']:
-                            analysis['common_tags'][tag] = analysis['common_tags'].get(tag, 0) + 1
-                    
-                    if note_analysis.get('has_frontmatter'):
-                        analysis['notes_with_frontmatter'] += 1
-                else:
-                    analysis['analysis_errors'] += 1
+            # 노트 분석은 I/O 바운드이므로 스레드 풀로 병렬 처리
+            # Note analysis is I/O-bound, so run it through a thread pool
+            # (OBSIDIAN_ANALYZE_SEQUENTIAL=1 로 디버깅용 순차 실행 가능)
+            # (set OBSIDIAN_ANALYZE_SEQUENTIAL=1 for sequential debugging)
+            if os.environ.get('OBSIDIAN_ANALYZE_SEQUENTIAL') or len(notes) <= 1:
+                self._aggregate_note_analyses(map(self.analyze_note, notes), analysis)
+            else:
+                max_workers = min(32, (os.cpu_count() or 4) * 4)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    # executor.map은 순서를 보존하므로 집계는 메인 스레드에서 수행
+                    # executor.map preserves order; aggregation stays on the main thread
+                    self._aggregate_note_analyses(
+                        executor.map(self.analyze_note, notes), analysis)
             
             if analysis['total_notes'] > 0:
                 analysis['average_word_count'] = analysis['total_words'] // analysis['total_notes']
@@ -411,7 +680,12 @@ class ObsidianManager:
             
             # 상위 10개 태그만 로그에 포함
             # Include only top 10 tags in log
-            top_tags = dict(sorted(analysis['common_tags'].items(), key=lambda x: x[1], reverse=True)[:10])
+            top_tags = dict(analysis['common_tags'].most_common(10))
+
+            # 집계용 Counter는 내부 구현 — 반환 전에 평범한 dict로 변환
+            # The Counter is an aggregation detail — convert to a plain dict
+            # before returning
+            analysis['common_tags'] = dict(analysis['common_tags'])
             
             # 관리 작업 로그 기록
             # Log management activity
@@ -453,6 +727,31 @@ class ObsidianManager:
             self.logger.error(f"노트 분석 실패: {str(e)}")
             return {'error': str(e)}
     
+    def _aggregate_note_analyses(self, note_analyses, analysis: Dict):
+        """
+        개별 노트 분석 결과를 전체 통계에 집계
+        Aggregate per-note analysis results into overall statistics
+
+        Args:
+            note_analyses: 노트 분석 결과 이터러블 / Iterable of note analysis results
+            analysis (Dict): 집계 대상 통계 / Statistics dict to update
+        """
+        for note_analysis in note_analyses:
+            if 'error' not in note_analysis:
+                analysis['total_words'] += note_analysis.get('word_count', 0)
+                analysis['total_chars'] += note_analysis.get('char_count', 0)
+
+                if note_analysis.get('tags'):
+                    analysis['notes_with_tags'] += 1
+                    # Counter.update는 C 레벨에서 리스트 전체를 집계
+                    # Counter.update aggregates the whole list at C level
+                    analysis['common_tags'].update(note_analysis['tags'])
+
+                if note_analysis.get('has_frontmatter'):
+                    analysis['notes_with_frontmatter'] += 1
+            else:
+                analysis['analysis_errors'] += 1
+
     def get_management_summary(self) -> Dict:
         """
         관리 작업 요약 정보 반환
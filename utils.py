@@ -5,10 +5,23 @@ Utility functions collection
 
 import os
 import re
+import math
+import string
 import hashlib
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+
+import frontmatter
+from typing import List, Dict, Optional, Set, Tuple
+
+# 모듈 로드 시 한 번만 컴파일되는 정규식 패턴
+# Regex patterns compiled once at module load
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+_UNDERSCORE_RE = re.compile(r'_+')
+_HASHTAG_RE = re.compile(r'#([a-zA-Z0-9가-힣_\-/]+)')
+_WIKILINK_RE = re.compile(r'\[\[([^\]|]+)(\|([^\]]+))?\]\]')
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?)?$')
 
 def sanitize_filename(filename: str) -> str:
     """
@@ -23,11 +36,11 @@ def sanitize_filename(filename: str) -> str:
     """
     # 특수문자를 언더스코어로 변경
     # Replace special characters with underscore
-    cleaned = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    
+    cleaned = _SANITIZE_RE.sub('_', filename)
+
     # 연속된 언더스코어 제거
     # Remove consecutive underscores
-    cleaned = re.sub(r'_+', '_', cleaned)
+    cleaned = _UNDERSCORE_RE.sub('_', cleaned)
     
     # 앞뒤 공백 및 점 제거
     # Remove leading/trailing spaces and dots
@@ -46,18 +59,17 @@ def extract_obsidian_tags(content: str) -> List[str]:
     Returns:
         List[str]: 태그 목록 / List of tags
     """
-    tags = []
-    
-    # #태그 형식 추출
-    # Extract #tag format
-    hashtag_pattern = r'#([a-zA-Z0-9가-힣_\-/]+)'
-    hashtags = re.findall(hashtag_pattern, content)
-    tags.extend(hashtags)
-    
+    # #태그 형식 추출 — 중간 리스트 없이 집합으로 바로 중복 제거
+    # Extract #tag format — dedupe directly into a set without an intermediate list
+    seen = set()
+    seen_add = seen.add
+    for m in _HASHTAG_RE.finditer(content):
+        seen_add(m.group(1))
+
     # YAML frontmatter에서 태그 추출 (기본적으로 frontmatter 라이브러리에서 처리)
     # Extract tags from YAML frontmatter (handled by frontmatter library)
-    
-    return list(set(tags))  # 중복 제거
+
+    return list(seen)
 
 def extract_wikilinks(content: str) -> List[Dict[str, str]]:
     """
@@ -74,8 +86,7 @@ def extract_wikilinks(content: str) -> List[Dict[str, str]]:
     
     # [[링크명|표시명]] 또는 [[링크명]] 형식
     # [[linkname|displayname]] or [[linkname]] format
-    wikilink_pattern = r'\[\[([^\]|]+)(\|([^\]]+))?\]\]'
-    matches = re.findall(wikilink_pattern, content)
+    matches = _WIKILINK_RE.findall(content)
     
     for match in matches:
         link_name = match[0].strip()
@@ -100,13 +111,20 @@ def calculate_file_hash(file_path: Path) -> str:
     Returns:
         str: MD5 해시 값 / MD5 hash value
     """
-    hash_md5 = hashlib.md5()
-    
     try:
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            # 3.11+: C 레벨 256KiB readinto 버퍼로 스트리밍
+            # 3.11+: streams through a C-level 256KiB readinto buffer
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "md5").hexdigest()
+
+            # ≤3.10 대체 경로: 256KiB memoryview로 readinto 루프
+            # Fallback for <=3.10: readinto loop over a 256KiB memoryview
+            hash_md5 = hashlib.md5()
+            mv = memoryview(bytearray(1 << 18))
+            while n := f.readinto(mv):
+                hash_md5.update(mv[:n])
+            return hash_md5.hexdigest()
     except Exception:
         return ""
 
@@ -121,17 +139,13 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         str: 형식화된 크기 / Formatted size
     """
-    if size_bytes == 0:
+    if size_bytes <= 0:
         return "0B"
-    
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
-    
-    return f"{size_bytes:.1f}{size_names[i]}"
+
+    # log2 한 번으로 단위 결정 — 1024 나눗셈 루프 대체
+    # One log2 picks the unit — replaces the divide-by-1024 loop
+    i = min(int(math.log2(size_bytes) // 10), len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.1f}{_SIZE_UNITS[i]}"
 
 def get_creation_date(file_path: Path) -> Optional[datetime]:
     """
@@ -168,45 +182,91 @@ def is_duplicate_content(file1: Path, file2: Path) -> bool:
         bool: 동일 여부 / Whether identical
     """
     try:
+        # 크기가 다르면 내용도 다름 — 해시 없이 즉시 반환
+        # Different sizes mean different content — return without hashing
+        s1, s2 = file1.stat(), file2.stat()
+        if s1.st_size != s2.st_size:
+            return False
+
+        # 작은 파일은 통째로 비교하는 편이 해시보다 빠름
+        # Small files are cheaper to compare whole than to hash
+        if s1.st_size < 4096:
+            return file1.read_bytes() == file2.read_bytes()
+
+        # 처음/마지막 4KiB 사전 비교 (rsync/fdupes 방식 사전 필터)
+        # Compare first/last 4KiB first (rsync/fdupes-style pre-filter)
+        with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
+            if f1.read(4096) != f2.read(4096):
+                return False
+            f1.seek(-4096, os.SEEK_END)
+            f2.seek(-4096, os.SEEK_END)
+            if f1.read(4096) != f2.read(4096):
+                return False
+
+        # 사전 필터 통과 시에만 전체 해시 비교
+        # Fall back to full hashing only when the pre-filter passes
         return calculate_file_hash(file1) == calculate_file_hash(file2)
     except Exception:
         return False
 
-def find_broken_links(vault_path: Path, note_content: str, note_path: Path) -> List[str]:
+def build_vault_index(vault_path: Path) -> Set[str]:
+    """
+    볼트 파일 인덱스 생성 (소문자 파일명 + 상대 경로)
+    Build a vault file index (lowercased basenames + relative paths)
+
+    Args:
+        vault_path (Path): 볼트 경로 / Vault path
+
+    Returns:
+        Set[str]: 링크 조회용 파일명/경로 집합 / Set of names/paths for link lookup
+    """
+    index = set()
+    root = str(vault_path)
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    index.add(entry.name.lower())
+                    rel = os.path.relpath(entry.path, root)
+                    index.add(rel.replace(os.sep, '/').lower())
+    return frozenset(index)
+
+def find_broken_links(vault_path: Path, note_content: str, note_path: Path,
+                      index: Optional[Set[str]] = None) -> List[str]:
     """
     깨진 링크 찾기
     Find broken links
-    
+
     Args:
         vault_path (Path): 볼트 경로 / Vault path
         note_content (str): 노트 내용 / Note content
         note_path (Path): 현재 노트 경로 / Current note path
-        
+        index (Set[str]): 사전 생성된 볼트 인덱스 (없으면 1회 생성)
+                          / Pre-built vault index (built once if absent)
+
     Returns:
         List[str]: 깨진 링크 목록 / List of broken links
     """
+    # 링크마다 stat 호출 대신 인덱스 집합에서 O(1) 조회
+    # O(1) set lookup per link instead of stat calls
+    if index is None:
+        index = build_vault_index(vault_path)
+
     broken_links = []
-    links = extract_wikilinks(note_content)
-    
-    for link_info in links:
+    for link_info in extract_wikilinks(note_content):
         link_name = link_info['link']
-        
-        # .md 확장자 추가하여 검색
-        # Search with .md extension added
-        possible_paths = [
-            vault_path / f"{link_name}.md",
-            vault_path / link_name,
-            note_path.parent / f"{link_name}.md",
-            note_path.parent / link_name
-        ]
-        
-        # 모든 가능한 경로 확인
-        # Check all possible paths
-        link_exists = any(path.exists() for path in possible_paths)
-        
-        if not link_exists:
+        key = link_name.lower()
+        if key not in index and f"{key}.md" not in index:
             broken_links.append(link_name)
-    
+
     return broken_links
 
 def create_note_template(title: str, tags: List[str] = None, template_type: str = "basic") -> str:
@@ -225,18 +285,26 @@ def create_note_template(title: str, tags: List[str] = None, template_type: str
     now = datetime.now()
     date_str = now.strftime("%Y-%m-%d")
     time_str = now.strftime("%Y-%m-%d %H:%M")
-    
+
     tags = tags or []
     tags_str = ", ".join(f'"{tag}"' for tag in tags) if tags else ""
-    
-    templates = {
-        "basic": f"""---
-title: "{title}"
-created: "{time_str}"
-tags: [{tags_str}]
+
+    # 선택된 템플릿 하나만 렌더링
+    # Render only the selected template
+    template = _TEMPLATES.get(template_type, _TEMPLATES["basic"])
+    return template.substitute(title=title, date_str=date_str,
+                               time_str=time_str, tags_str=tags_str)
+
+# 모듈 로드 시 한 번만 구성되는 노트 템플릿
+# Note templates built once at module load
+_TEMPLATES = {
+    "basic": string.Template("""---
+title: "$title"
+created: "$time_str"
+tags: [$tags_str]
 ---
 
-# {title}
+# $title
 
 ## 개요 / Overview
 
@@ -246,23 +314,23 @@ tags: [{tags_str}]
 
 ## 참고 사항 / Notes
 
-""",
-        
-        "project": f"""---
-title: "{title}"
-created: "{time_str}"
-tags: [{tags_str}, "project"]
+"""),
+
+    "project": string.Template("""---
+title: "$title"
+created: "$time_str"
+tags: [$tags_str, "project"]
 status: "진행중"
 priority: "보통"
 due_date: ""
 ---
 
-# 📋 {title}
+# 📋 $title
 
 ## 🎯 프로젝트 목표 / Project Goals
 
 ## 📅 일정 / Timeline
-- 시작일: {date_str}
+- 시작일: $date_str
 - 마감일: 
 - 현재 상태: 진행중
 
@@ -275,20 +343,20 @@ due_date: ""
 
 ## 📊 결과 / Results
 
-""",
-        
-        "meeting": f"""---
-title: "{title}"
-created: "{time_str}"
-tags: [{tags_str}, "meeting"]
-date: "{date_str}"
+"""),
+
+    "meeting": string.Template("""---
+title: "$title"
+created: "$time_str"
+tags: [$tags_str, "meeting"]
+date: "$date_str"
 attendees: []
 ---
 
-# 🤝 {title}
+# 🤝 $title
 
 ## 📅 회의 정보 / Meeting Info
-- 날짜: {date_str}
+- 날짜: $date_str
 - 참석자: 
 - 장소: 
 
@@ -302,10 +370,8 @@ attendees: []
 
 ## 🔗 관련 자료 / Related Materials
 
-"""
-    }
-    
-    return templates.get(template_type, templates["basic"])
+""")
+}
 
 def validate_frontmatter(content: str) -> Tuple[bool, List[str]]:
     """
@@ -318,33 +384,30 @@ def validate_frontmatter(content: str) -> Tuple[bool, List[str]]:
     Returns:
         Tuple[bool, List[str]]: (유효성, 오류 목록) / (validity, error list)
     """
-    errors = []
-    
-    if not content.startswith('---'):
+    if content[:3] != '---':
         return True, []  # frontmatter가 없는 경우는 유효
-    
+
+    errors = []
+
     try:
-        import frontmatter
         post = frontmatter.loads(content)
-        
+
         # 필수 필드 확인
         # Check required fields
         if 'title' not in post.metadata:
             errors.append("title 필드가 없습니다")
-        
-        # 날짜 형식 확인
-        # Check date format
+
+        # 날짜 형식 확인 (전체 파싱 대신 정규식 검사)
+        # Check date format (regex match instead of full parsing)
         date_fields = ['created', 'modified', 'due_date']
         for field in date_fields:
             if field in post.metadata:
                 date_value = post.metadata[field]
                 if isinstance(date_value, str) and date_value:
-                    try:
-                        datetime.fromisoformat(date_value.replace('Z', '+00:00'))
-                    except ValueError:
+                    if not _ISO_DATE_RE.match(date_value):
                         errors.append(f"{field} 날짜 형식이 올바르지 않습니다")
-        
+
     except Exception as e:
         errors.append(f"frontmatter 파싱 오류: {str(e)}")
-    
-    return len(errors) == 0, errors 
\ No newline at end of file
+
+    return len(errors) == 0, errors
\ No newline at end of file
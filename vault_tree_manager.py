@@ -5,16 +5,136 @@ Obsidian Vault Tree Structure Manager
 
 import os
 import time
+import bisect
+import hashlib
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 
 from config import SUPPORTED_EXTENSIONS, get_vault_path
 from management_log import ManagementLogger
 
+# 확장자 분류는 frozenset 해시 조회 1회로 끝남 (endswith 스캔 불필요)
+# Extension classification is one frozenset hash lookup (no endswith scan)
+_SUPPORTED_SUFFIX_SET = frozenset(ext.lower() for ext in SUPPORTED_EXTENSIONS)
+
+# 확장자 → 트리 아이콘
+# Suffix -> tree icon
+_SUFFIX_ICONS = {'.md': '📝'}
+_DEFAULT_FILE_ICON = '📄'
+
+# 마크다운 헤더/푸터는 모듈 로드 시 한 번만 구성되는 상수 — 호출마다
+# 대형 f-string을 다시 조립하지 않고 format_map으로 값만 채움
+# Markdown header/footer are built once at module load — each call only
+# fills the slots via format_map instead of re-assembling a large f-string
+_MD_HEADER = """# 🌳 옵시디언 볼트 구조
+# Obsidian Vault Structure
+
+> **자동 생성된 볼트 트리 구조입니다.**  
+> **Auto-generated vault tree structure.**
+
+**📍 볼트 경로**: `{vault_path}`  
+**🕒 마지막 업데이트**: {current_time}  
+**📊 업데이트 유형**: 자동 감지 / Auto-detected
+
+---
+
+## 📈 볼트 통계 / Vault Statistics
+
+| 항목 / Item | 개수 / Count |
+|-------------|--------------|
+| 📁 **총 폴더 수** / Total Folders | {total_folders} |
+| 📄 **총 파일 수** / Total Files | {total_files} |
+| 📝 **마크다운 파일** / Markdown Files | {md_files} |
+| 📋 **기타 파일** / Other Files | {other_files} |
+
+---
+
+## 🌲 폴더 트리 구조 / Folder Tree Structure
+
+```
+🏠 {vault_name}
+"""
+
+_MD_FOOTER = """```
+
+---
+
+## 📝 업데이트 정보 / Update Information
+
+- **자동 감지**: 파일 생성, 삭제, 이동 시 자동 업데이트
+- **실시간 모니터링**: 볼트 내 변화를 실시간으로 감지
+- **Auto Detection**: Automatically updates when files are created, deleted, or moved
+- **Real-time Monitoring**: Detects changes in vault in real-time
+
+---
+
+## 🔧 관리 명령어 / Management Commands
+
+```bash
+# 트리 구조 수동 업데이트 / Manual tree update
+python main.py update-tree
+
+# 실시간 감지 시작 / Start real-time monitoring
+python main.py watch-vault
+
+# 실시간 감지 중지 / Stop real-time monitoring  
+python main.py stop-watch
+```
+
+> 💡 **팁**: 이 파일은 자동으로 생성되므로 수동으로 편집하지 마세요!  
+> **Tip**: This file is auto-generated, please don't edit manually!
+
+---
+
+*Generated by Obsidian Management System* 🤖
+"""
+
+# 푸터는 완전히 정적이므로 인코딩도 임포트 시 한 번만 수행
+# The footer is fully static, so it is encoded once at import time
+_MD_FOOTER_BYTES = _MD_FOOTER.encode('utf-8')
+
+# OS 네이티브 감시(inotify 등)가 동작하지 않는 네트워크 파일시스템 유형
+# Network filesystem types where native watching (inotify etc.) is unreliable
+_NETWORK_FS_TYPES = frozenset({
+    'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'fuse.sshfs', 'fuse.rclone',
+})
+
+
+def _is_network_mount(path: str) -> bool:
+    """
+    경로가 네트워크 파일시스템 위에 있는지 휴리스틱으로 판별
+    Heuristically determine whether a path sits on a network filesystem
+
+    Args:
+        path (str): 검사할 경로 / Path to check
+
+    Returns:
+        bool: 네트워크 마운트 여부 / Whether it is a network mount
+    """
+    try:
+        real = os.path.realpath(path)
+        best_len, best_fstype = -1, ''
+        with open('/proc/mounts', encoding='utf-8') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount_point, fstype = fields[1], fields[2]
+                if ((real == mount_point or real.startswith(mount_point.rstrip('/') + '/'))
+                        and len(mount_point) > best_len):
+                    best_len, best_fstype = len(mount_point), fstype
+        return best_fstype in _NETWORK_FS_TYPES
+    except OSError:
+        # /proc/mounts가 없는 플랫폼(macOS/Windows)은 네이티브 감시자 사용
+        # Platforms without /proc/mounts (macOS/Windows) use the native observer
+        return False
+
 class VaultTreeEventHandler(FileSystemEventHandler):
     """볼트 파일 시스템 이벤트 핸들러"""
     """Vault file system event handler"""
@@ -29,28 +149,95 @@ class VaultTreeEventHandler(FileSystemEventHandler):
         """
         super().__init__()
         self.tree_manager = tree_manager
-        self.last_update = time.time()
-        self.update_delay = 2.0  # 2초 딜레이로 중복 업데이트 방지
-    
-    def on_any_event(self, event):
+        # 자기 출력물 경로는 생성 시점에 한 번만 해석해 둠 (이벤트마다 resolve 금지)
+        # Resolve our own output paths once at construction (no resolve per event)
+        self._ignore_paths = frozenset(tree_manager._ignore_paths)
+        self.update_delay = 2.0  # 2초 조용한 구간 후 한 번만 업데이트
+
+        # 이벤트 폭주를 하나의 업데이트로 합치는 디바운스 상태
+        # Debounce state coalescing event bursts into a single update
+        self._pending = threading.Event()
+        self._lock = threading.Lock()
+        self._last_event_time = 0.0
+        self._worker = threading.Thread(target=self._debounce_worker, daemon=True)
+        self._worker.start()
+
+    def on_created(self, event):
+        self._handle_event(event)
+
+    def on_deleted(self, event):
+        self._handle_event(event)
+
+    def on_moved(self, event):
+        self._handle_event(event)
+
+    def on_modified(self, event):
+        self._handle_event(event)
+
+    def _is_relevant(self, path: str, is_directory: bool) -> bool:
         """
-        모든 파일 시스템 이벤트 처리
-        Handle all file system events
+        경로 하나가 트리에 영향을 주는지 판별 (무시 경로·성분·확장자 검사)
+        Decide whether one path can affect the tree (ignore paths,
+        ignored components, supported suffix)
         """
-        # 숨김 파일이나 시스템 파일 무시
-        # Ignore hidden files or system files
-        if '/.obsidian' in event.src_path or '/.git' in event.src_path:
-            return
-        
-        # 지원하는 파일 확장자만 처리
-        # Process only supported file extensions
-        if event.is_directory or any(event.src_path.endswith(ext) for ext in SUPPORTED_EXTENSIONS):
-            current_time = time.time()
-            if current_time - self.last_update > self.update_delay:
-                self.last_update = current_time
-                # 딜레이 후 업데이트 (중복 방지)
-                # Update after delay (prevent duplicates)
-                threading.Timer(self.update_delay, self.tree_manager.update_tree_structure).start()
+        # 우리가 직접 쓰는 트리 파일의 이벤트는 무시 (자기 재귀 방지)
+        # Ignore events on the tree file we write ourselves (no self-recursion)
+        if os.path.abspath(path) in self._ignore_paths:
+            return False
+
+        # 무시 대상 디렉토리 내부는 경로 성분 검사로 통째로 걸러냄
+        # (.obsidian, .git, node_modules 등 — 캐시 무효화 방지)
+        # Filter out anything under ignored directories by path component
+        # (.obsidian, .git, node_modules etc. — avoids needless cache invalidation)
+        rel = os.path.relpath(path, str(self.tree_manager.vault_path))
+        if any(self.tree_manager._should_ignore_name(part) for part in rel.split(os.sep)):
+            return False
+
+        # 디렉토리이거나 지원하는 파일 확장자만 트리에 영향
+        # Only directories and supported file extensions affect the tree
+        return is_directory or os.path.splitext(path)[1].lower() in _SUPPORTED_SUFFIX_SET
+
+    def _handle_event(self, event):
+        """
+        파일 시스템 이벤트를 트리 캐시에 반영하고 재렌더링 예약
+        Apply a file system event to the tree cache and schedule a re-render
+        """
+        # 이동 이벤트는 src/dest를 독립적으로 평가 — .trash 복원이나 원자적
+        # 저장(x.md.tmp → x.md)처럼 한쪽만 유효한 경우도 처리해야 함
+        # Moved events evaluate src and dest independently — one valid side is
+        # enough (.trash restores, atomic-save renames like x.md.tmp → x.md)
+        if event.event_type == 'moved':
+            relevant = (self._is_relevant(event.src_path, event.is_directory)
+                        or self._is_relevant(event.dest_path, event.is_directory))
+        else:
+            relevant = self._is_relevant(event.src_path, event.is_directory)
+
+        # 캐시 변경이 있을 때만 재렌더링 표시
+        # Mark for re-render only when the cache actually changed
+        if relevant and self.tree_manager._apply_event(event):
+            with self._lock:
+                self._last_event_time = time.monotonic()
+            self._pending.set()
+
+    def _debounce_worker(self):
+        """
+        이벤트가 잦아들 때까지 기다렸다가 한 번만 트리를 재생성하는 워커
+        Worker that waits for events to quiet down, then rebuilds the tree once
+        """
+        while True:
+            self._pending.wait()
+
+            # 마지막 이벤트 이후 조용한 구간이 지날 때까지 대기 (폭주 병합)
+            # Wait out the quiet period after the last event (coalesces bursts)
+            while True:
+                with self._lock:
+                    remaining = self.update_delay - (time.monotonic() - self._last_event_time)
+                if remaining <= 0:
+                    break
+                time.sleep(remaining)
+
+            self._pending.clear()
+            self.tree_manager.update_tree_structure()
 
 class VaultTreeManager:
     """옵시디언 볼트 트리 구조 관리 클래스"""
@@ -68,6 +255,12 @@ class VaultTreeManager:
         # 프로젝트 폴더 내에 트리 파일 생성
         # Create tree file in project folder
         self.tree_file = Path.cwd() / "볼트구조.md"
+        # 워처가 자기 출력물에 반응하지 않도록 무시할 절대 경로 집합
+        # Absolute paths the watcher must ignore (our own output files)
+        self._ignore_paths = {
+            str(self.tree_file.resolve()),
+            str(self.tree_file.resolve()) + '.tmp',
+        }
         self.observer = None
         self.is_watching = False
         
@@ -84,105 +277,120 @@ class VaultTreeManager:
         
         if not self.vault_path.exists():
             raise ValueError(f"볼트 경로를 찾을 수 없습니다: {vault_path}")
-    
-    def _should_ignore(self, path: Path) -> bool:
+
+        # 인메모리 트리 캐시: 디렉토리 경로 → {'dirs', 'files', 'all_files'}
+        # 이벤트가 캐시를 수술적으로 갱신하므로 편집마다 전체 재스캔이 없음
+        # In-memory tree cache: directory path -> {'dirs', 'files', 'all_files'}
+        # Events mutate it surgically, so edits don't trigger full rescans
+        self._tree_cache: Optional[Dict[str, Dict]] = None
+        self._tree_lock = threading.Lock()
+
+        # 마지막으로 기록한 트리 본문의 해시 — 변경 없으면 재작성 생략
+        # Hash of the last written tree body — skips rewrites when unchanged
+        self._tree_hash: Optional[str] = None
+        self._last_tree_hash: Optional[str] = None
+
+        # get_status용 트리 파일 stat 메모 — (monotonic 시각, (존재, 크기, 수정시각))
+        # Tree-file stat memo for get_status — (monotonic ts, (exists, size, mtime))
+        self._stat_cache: Optional[tuple] = None
+
+    def _should_ignore_name(self, name: str) -> bool:
         """
-        경로를 무시해야 하는지 확인
-        Check if path should be ignored
-        
+        항목 이름만으로 무시 여부 확인 (경로 분해 없음)
+        Check if an entry should be ignored by basename alone (no path splitting)
+
+        순회가 이미 허용된 디렉토리로만 내려가므로 하위 항목은
+        basename 검사만으로 충분합니다.
+        The walk only descends into accepted directories, so descendants
+        only need a basename check.
+
         Args:
-            path (Path): 확인할 경로 / Path to check
-            
+            name (str): 항목 이름 / Entry name
+
         Returns:
             bool: 무시해야 하면 True / True if should be ignored
         """
-        for part in path.parts:
-            if part in self.ignore_patterns or part.startswith('.'):
-                return True
-        return False
+        return name in self.ignore_patterns or name.startswith('.')
     
-    def _generate_tree_structure(self, directory: Path, prefix: str = "", is_last: bool = True) -> List[str]:
+    def _scan_tree(self):
         """
-        디렉토리 트리 구조 생성
-        Generate directory tree structure
-        
-        Args:
-            directory (Path): 스캔할 디렉토리 / Directory to scan
-            prefix (str): 트리 라인 접두사 / Tree line prefix
-            is_last (bool): 마지막 항목인지 여부 / Whether it's the last item
-            
-        Returns:
-            List[str]: 트리 구조 라인들 / Tree structure lines
+        디스크를 한 번 걸어 트리 캐시를 새로 구축 — 최상위 하위 디렉토리는
+        스레드 풀로 병렬 스캔 (scandir/stat 시스템콜 동안 GIL이 풀리므로
+        I/O 바운드 순회에서 이득, 특히 HDD·네트워크 드라이브)
+        Build the tree cache fresh with a single disk walk — top-level
+        subdirectories are scanned in parallel via a thread pool (the GIL is
+        released around scandir/stat syscalls, so I/O-bound walks benefit,
+        especially on HDDs and network drives)
         """
-        lines = []
-        
+        root = str(self.vault_path)
+        cache: Dict[str, Dict] = {}
+        root_node = self._scan_node(root)
+        cache[root] = root_node
+        top_dirs = [os.path.join(root, name) for name in root_node['dirs']]
+
+        if len(top_dirs) > 1:
+            def scan_subtree(subdir: str) -> Dict[str, Dict]:
+                local: Dict[str, Dict] = {}
+                self._scan_directory(subdir, local)
+                return local
+
+            max_workers = min(8, (os.cpu_count() or 1) * 2, len(top_dirs))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for local in executor.map(scan_subtree, top_dirs):
+                    cache.update(local)
+        elif top_dirs:
+            self._scan_directory(top_dirs[0], cache)
+
+        self._tree_cache = cache
+
+    def _scan_node(self, dirpath: str) -> Dict:
+        """
+        디렉토리 하나를 스캔하여 캐시 노드 반환 (DirEntry의 stat 캐시 활용)
+        Scan one directory into a cache node (reuses DirEntry's cached stat)
+        """
+        dirs: List[str] = []
+        shown_files: List[str] = []
+        all_files = 0
         try:
-            # 디렉토리 내 모든 항목 가져오기
-            # Get all items in directory
-            items = []
-            for item in directory.iterdir():
-                if not self._should_ignore(item):
-                    items.append(item)
-            
-            # 디렉토리와 파일 분리 및 정렬
-            # Separate and sort directories and files
-            directories = sorted([item for item in items if item.is_dir()])
-            files = sorted([item for item in items if item.is_file() and 
-                          any(item.name.endswith(ext) for ext in SUPPORTED_EXTENSIONS)])
-            
-            all_items = directories + files
-            
-            for i, item in enumerate(all_items):
-                is_last_item = i == len(all_items) - 1
-                
-                # 트리 브랜치 문자 결정
-                # Determine tree branch characters
-                if is_last_item:
-                    current_prefix = "└── "
-                    next_prefix = prefix + "    "
-                else:
-                    current_prefix = "├── "
-                    next_prefix = prefix + "│   "
-                
-                # 아이템 이름과 아이콘 결정
-                # Determine item name and icon
-                if item.is_dir():
-                    icon = "📁"
-                    item_name = f"{icon} **{item.name}**"
-                else:
-                    # 파일 확장자에 따른 아이콘
-                    # Icon based on file extension
-                    if item.suffix == '.md':
-                        icon = "📝"
-                    else:
-                        icon = "📄"
-                    item_name = f"{icon} {item.name}"
-                
-                lines.append(f"{prefix}{current_prefix}{item_name}")
-                
-                # 디렉토리인 경우 재귀적으로 하위 구조 생성
-                # Recursively generate sub-structure for directories
-                if item.is_dir():
-                    sub_lines = self._generate_tree_structure(item, next_prefix, is_last_item)
-                    lines.extend(sub_lines)
-                    
-        except PermissionError:
-            lines.append(f"{prefix}├── ❌ 접근 권한 없음 / Permission Denied")
-        except Exception as e:
-            lines.append(f"{prefix}├── ⚠️ 오류: {str(e)} / Error: {str(e)}")
-        
-        return lines
-    
-    def _count_items(self, directory: Path) -> Dict[str, int]:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    name = entry.name
+                    if self._should_ignore_name(name):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(name)
+                    elif entry.is_file(follow_symlinks=False):
+                        all_files += 1
+                        if os.path.splitext(name)[1].lower() in _SUPPORTED_SUFFIX_SET:
+                            shown_files.append(name)
+        except OSError:
+            # 순회 중 사라졌거나 접근 불가한 디렉토리는 빈 노드로 남김
+            # Leave an empty node for directories that vanished mid-walk
+            pass
+
+        dirs.sort()
+        shown_files.sort()
+        return {'dirs': dirs, 'files': shown_files, 'all_files': all_files}
+
+    def _scan_directory(self, dirpath: str, cache: Dict[str, Dict]):
         """
-        디렉토리 내 항목 수 계산
-        Count items in directory
-        
-        Args:
-            directory (Path): 스캔할 디렉토리 / Directory to scan
-            
+        서브트리를 스캔하여 캐시 노드 생성 (명시적 스택으로 재귀 없이 순회)
+        Scan a subtree into cache nodes (explicit stack, no recursion)
+        """
+        pending = [dirpath]
+        while pending:
+            current = pending.pop()
+            node = self._scan_node(current)
+            cache[current] = node
+            pending.extend(os.path.join(current, name) for name in node['dirs'])
+
+    def _render_tree(self) -> tuple:
+        """
+        캐시된 트리에서 라인과 통계를 렌더링 (디스크 접근 없음)
+        Render lines and statistics from the cached tree (no disk access)
+
         Returns:
-            Dict[str, int]: 항목 수 통계 / Item count statistics
+            tuple: (트리 라인 목록, 통계) / (tree lines, stats)
         """
         stats = {
             'total_folders': 0,
@@ -190,115 +398,235 @@ class VaultTreeManager:
             'md_files': 0,
             'other_files': 0
         }
-        
-        try:
-            for item in directory.rglob('*'):
-                if self._should_ignore(item):
-                    continue
-                
-                if item.is_dir():
-                    stats['total_folders'] += 1
-                elif item.is_file():
-                    stats['total_files'] += 1
-                    if item.suffix == '.md':
-                        stats['md_files'] += 1
-                    elif any(item.name.endswith(ext) for ext in SUPPORTED_EXTENSIONS):
-                        stats['other_files'] += 1
-        except Exception:
-            pass
-        
-        return stats
-    
-    def generate_tree_markdown(self) -> str:
+        lines = self._render_directory(str(self.vault_path), stats, "")
+        return lines, stats
+
+    def _render_directory(self, dirpath: str, stats: Dict[str, int], prefix: str) -> List[str]:
         """
-        마크다운 형식의 트리 구조 생성
-        Generate tree structure in markdown format
-        
-        Returns:
-            str: 마크다운 형식의 트리 구조 / Tree structure in markdown format
+        캐시 노드 하나를 트리 라인으로 렌더링
+        Render one cache node into tree lines
         """
-        start_time = time.time()
-        
-        try:
-            # 통계 정보 수집
-            # Collect statistics
-            stats = self._count_items(self.vault_path)
-            
-            # 마크다운 헤더 생성
-            # Generate markdown header
-            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            markdown_content = f"""# 🌳 옵시디언 볼트 구조
-# Obsidian Vault Structure
+        lines: List[str] = []
 
-> **자동 생성된 볼트 트리 구조입니다.**  
-> **Auto-generated vault tree structure.**
+        # 명시적 항목 스택으로 재귀 제거 — 아주 깊은 볼트에서도 RecursionError
+        # 없이 일정한 파이썬 스택만 사용. 자식을 역순으로 push해야 pop 순서가
+        # 사전식 출력 순서를 보존함
+        # Explicit per-entry stack instead of recursion — constant Python stack
+        # depth even for very deep vaults. Children are pushed in reverse so
+        # pop order preserves the lexicographic output order
+        stack: List[tuple] = []
 
-**📍 볼트 경로**: `{self.vault_path}`  
-**🕒 마지막 업데이트**: {current_time}  
-**📊 업데이트 유형**: 자동 감지 / Auto-detected
+        def expand(parent: str, parent_prefix: str) -> None:
+            node = self._tree_cache.get(parent)
+            if node is None:
+                return
+            dirs = node['dirs']
+            stats['total_folders'] += len(dirs)
+            stats['total_files'] += node['all_files']
+            entries = dirs + node['files']
+            n_dirs = len(dirs)
+            last = len(entries) - 1
+            for i in range(last, -1, -1):
+                stack.append((parent, entries[i], i < n_dirs,
+                              parent_prefix, i == last))
 
----
+        expand(dirpath, prefix)
+        while stack:
+            parent, name, is_dir, item_prefix, is_last_item = stack.pop()
 
-## 📈 볼트 통계 / Vault Statistics
+            # 트리 브랜치 문자 결정
+            # Determine tree branch characters
+            if is_last_item:
+                current_prefix = "└── "
+                next_prefix = item_prefix + "    "
+            else:
+                current_prefix = "├── "
+                next_prefix = item_prefix + "│   "
 
-| 항목 / Item | 개수 / Count |
-|-------------|--------------|
-| 📁 **총 폴더 수** / Total Folders | {stats['total_folders']} |
-| 📄 **총 파일 수** / Total Files | {stats['total_files']} |
-| 📝 **마크다운 파일** / Markdown Files | {stats['md_files']} |
-| 📋 **기타 파일** / Other Files | {stats['other_files']} |
+            # 아이템 이름과 아이콘 결정
+            # Determine item name and icon
+            if is_dir:
+                item_name = f"📁 **{name}**"
+            else:
+                # 확장자 → 아이콘은 dict 조회 한 번으로 결정
+                # Suffix -> icon resolved with a single dict lookup
+                suffix = os.path.splitext(name)[1].lower()
+                if suffix == '.md':
+                    stats['md_files'] += 1
+                else:
+                    stats['other_files'] += 1
+                icon = _SUFFIX_ICONS.get(suffix, _DEFAULT_FILE_ICON)
+                item_name = f"{icon} {name}"
 
----
+            lines.append(f"{item_prefix}{current_prefix}{item_name}")
 
-## 🌲 폴더 트리 구조 / Folder Tree Structure
+            # 디렉토리면 하위 항목들을 스택에 적재 (라인은 부모 바로 뒤에 이어짐)
+            # For directories, push children (their lines follow immediately)
+            if is_dir:
+                expand(os.path.join(parent, name), next_prefix)
 
-```
-🏠 {self.vault_path.name}
-"""
-            
-            # 트리 구조 생성
-            # Generate tree structure
-            tree_lines = self._generate_tree_structure(self.vault_path)
-            
-            for line in tree_lines:
-                markdown_content += line + "\n"
-            
-            markdown_content += """```
+        return lines
 
----
+    def _apply_event(self, event) -> bool:
+        """
+        파일 시스템 이벤트를 트리 캐시에 수술적으로 반영
+        Apply a file system event to the tree cache surgically
 
-## 📝 업데이트 정보 / Update Information
+        Args:
+            event: watchdog 이벤트 / watchdog event
 
-- **자동 감지**: 파일 생성, 삭제, 이동 시 자동 업데이트
-- **실시간 모니터링**: 볼트 내 변화를 실시간으로 감지
-- **Auto Detection**: Automatically updates when files are created, deleted, or moved
-- **Real-time Monitoring**: Detects changes in vault in real-time
+        Returns:
+            bool: 트리 모양이 바뀌어 재렌더링이 필요하면 True
+                  / True when the tree shape changed and needs a re-render
+        """
+        with self._tree_lock:
+            if self._tree_cache is None:
+                return True  # 다음 업데이트에서 전체 재스캔 / full rescan on next update
 
----
+            etype = event.event_type
+            if etype == 'modified':
+                # 내용 변경은 트리 모양에 영향 없음 — 재작성 불필요
+                # Content edits don't change the tree shape — no rewrite needed
+                return False
 
-## 🔧 관리 명령어 / Management Commands
+            try:
+                if etype == 'created':
+                    return self._cache_add(event.src_path, event.is_directory)
+                if etype == 'deleted':
+                    return self._cache_remove(event.src_path, event.is_directory)
+                if etype == 'moved':
+                    # src/dest를 독립적으로 처리 — 한쪽이 무시 대상이어도
+                    # (예: .trash에서 복원) 나머지 쪽은 반영되어야 함
+                    # Handle src/dest independently — one side being ignored
+                    # (e.g. restoring from .trash) must not drop the other
+                    removed = added = False
+                    if self._is_tracked_path(event.src_path):
+                        removed = self._cache_remove(event.src_path, event.is_directory)
+                    if self._is_tracked_path(event.dest_path):
+                        added = self._cache_add(event.dest_path, event.is_directory)
+                    return removed or added
+                return False
+            except (KeyError, OSError):
+                # 캐시와 실제 상태가 어긋나면 전체 재스캔으로 복구
+                # Recover with a full rescan when the cache disagrees with disk
+                self._tree_cache = None
+                return True
 
-```bash
-# 트리 구조 수동 업데이트 / Manual tree update
-python main.py update-tree
+    def _is_tracked_path(self, path: str) -> bool:
+        """경로의 어떤 성분도 무시 대상이 아니면 True"""
+        """True when no component of the path is ignored"""
+        rel = os.path.relpath(path, str(self.vault_path))
+        return not any(self._should_ignore_name(part) for part in rel.split(os.sep))
 
-# 실시간 감지 시작 / Start real-time monitoring
-python main.py watch-vault
+    def _cache_add(self, path: str, is_directory: bool) -> bool:
+        """캐시에 항목 추가 (디렉토리는 하위 트리 스캔)"""
+        """Add an entry to the cache (scans the subtree for directories)"""
+        parent, name = os.path.split(path)
+        if self._should_ignore_name(name):
+            return False
 
-# 실시간 감지 중지 / Stop real-time monitoring  
-python main.py stop-watch
-```
+        node = self._tree_cache.get(parent)
+        if node is None:
+            raise KeyError(parent)
 
-> 💡 **팁**: 이 파일은 자동으로 생성되므로 수동으로 편집하지 마세요!  
-> **Tip**: This file is auto-generated, please don't edit manually!
+        if is_directory:
+            if name not in node['dirs']:
+                bisect.insort(node['dirs'], name)
+                self._scan_directory(path, self._tree_cache)
+            return True
 
----
+        # _scan_node와 동일한 확장자 필터 — 표시 목록에는 지원 확장자만 싣고,
+        # 그 외 파일은 개수에만 반영 (예: a.md → a.png 이름 변경)
+        # Same suffix filter as _scan_node — only supported suffixes go on the
+        # shown list, other files only affect the count (e.g. a.md → a.png)
+        if os.path.splitext(name)[1].lower() not in _SUPPORTED_SUFFIX_SET:
+            node['all_files'] += 1
+            return True
+        if name not in node['files']:
+            bisect.insort(node['files'], name)
+            node['all_files'] += 1
+            return True
+        return False
 
-*Generated by Obsidian Management System* 🤖
-"""
+    def _cache_remove(self, path: str, is_directory: bool) -> bool:
+        """캐시에서 항목 제거 (디렉토리는 하위 트리 노드까지 정리)"""
+        """Remove an entry from the cache (drops subtree nodes for directories)"""
+        parent, name = os.path.split(path)
+        node = self._tree_cache.get(parent)
+        if node is None:
+            raise KeyError(parent)
+
+        if is_directory:
+            try:
+                node['dirs'].remove(name)
+            except ValueError:
+                return False
+            prefix = path + os.sep
+            for key in [k for k in self._tree_cache if k == path or k.startswith(prefix)]:
+                del self._tree_cache[key]
+            return True
+
+        try:
+            node['files'].remove(name)
+        except ValueError:
+            # 표시 목록에 없던 파일 (미지원 확장자 등) — 개수는 건드리지 않음.
+            # 생성 시점에도 집계되지 않았으므로 그대로 두는 쪽이 스캔과 일치
+            # File that was never on the shown list (unsupported suffix etc.)
+            # — leave the count alone; it matches a fresh scan because the
+            # creation was equally unseen
+            return False
+        node['all_files'] -= 1
+        return True
+    
+    def generate_tree_markdown(self) -> bytes:
+        """
+        마크다운 형식의 트리 구조 생성 (UTF-8 바이트)
+        Generate tree structure in markdown format (UTF-8 bytes)
+        
+        Returns:
+            bytes: UTF-8 인코딩된 트리 구조 / Tree structure encoded as UTF-8
+        """
+        # 소요 시간 계산은 벽시계 점프(NTP/DST)에 영향받지 않는 단조 시계 사용
+        # Durations use the monotonic clock, immune to wall-clock jumps (NTP/DST)
+        start_time = time.monotonic()
+        
+        try:
+            # 캐시가 없을 때만 디스크를 걷고, 렌더링은 인메모리 트리에서 수행
+            # Walk the disk only when the cache is cold; render from the in-memory tree
+            with self._tree_lock:
+                if self._tree_cache is None:
+                    self._scan_tree()
+                tree_lines, stats = self._render_tree()
             
-            duration = time.time() - start_time
+            # 마크다운 헤더 생성 — 정적 본문은 모듈 상수, 값만 채움
+            # Generate markdown header — static body is a module constant
+            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+            header = _MD_HEADER.format_map({
+                'vault_path': self.vault_path,
+                'vault_name': self.vault_path.name,
+                'current_time': current_time,
+                **stats,
+            })
+            
+            # 바이트 단위로 한 번에 조립 — 트리 본문은 해시 계산과 파일
+            # 쓰기에 같은 인코딩 결과를 재사용하고, 푸터는 사전 인코딩 상수
+            # Assemble as bytes in one join — the tree body encoding is shared
+            # between hashing and the file write, the footer is pre-encoded
+            parts = [header.encode('utf-8')]
+            tree_body = "\n".join(tree_lines).encode('utf-8')
+
+            # 본문 해시는 재작성 생략 판단에 사용 (타임스탬프 헤더는 제외)
+            # The body hash drives rewrite skipping (timestamp header excluded)
+            self._tree_hash = hashlib.blake2b(tree_body,
+                                              digest_size=16).hexdigest()
+            if tree_lines:
+                parts.append(tree_body)
+                parts.append(b"\n")
+            parts.append(_MD_FOOTER_BYTES)
+            markdown_content = b"".join(parts)
+
+            duration = time.monotonic() - start_time
             
             # 관리 작업 로그 기록
             # Log management activity
@@ -318,7 +646,7 @@ python main.py stop-watch
             return markdown_content
             
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             
             # 오류 로그 기록
             # Log error
@@ -339,12 +667,24 @@ python main.py stop-watch
         """
         try:
             markdown_content = self.generate_tree_markdown()
-            
-            # 마크다운 파일에 저장
-            # Save to markdown file
-            with open(self.tree_file, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
-                
+
+            # 트리 본문이 그대로면 디스크 재작성 생략 (git/동기화 도구 소음 방지)
+            # Skip the disk rewrite when the tree body is unchanged
+            # (avoids noise for git/sync tools watching the file)
+            if self._tree_hash == self._last_tree_hash and self.tree_file.exists():
+                print("♻️ 트리 변경 없음 — 파일 재작성 생략")
+                print("♻️ Tree unchanged — skipping file rewrite")
+                return
+
+            # 임시 파일에 쓴 뒤 원자적으로 교체 — 반쯤 쓰인 파일이 노출되지 않음
+            # Write to a temp file, then replace atomically — readers (and the
+            # watcher itself) never see a half-written file
+            tmp = self.tree_file.with_name(self.tree_file.name + '.tmp')
+            tmp.write_bytes(markdown_content)
+            os.replace(tmp, self.tree_file)
+            self._last_tree_hash = self._tree_hash
+            self._stat_cache = None
+
             print(f"🌳 트리 구조 업데이트 완료: {self.tree_file}")
             print(f"🌳 Tree structure updated: {self.tree_file}")
             
@@ -363,13 +703,25 @@ python main.py stop-watch
             return
         
         try:
+            # 감시 (재)시작 시 전체 재스캔으로 캐시를 새로 구축
+            # Rebuild the cache from scratch when (re)starting the watcher
+            with self._tree_lock:
+                self._tree_cache = None
+
             # 초기 트리 구조 생성
             # Generate initial tree structure
             self.update_tree_structure()
             
-            # 감시자 설정
-            # Setup observer
-            self.observer = Observer()
+            # 감시자 설정 — 네트워크 마운트에서는 네이티브 백엔드가 이벤트를
+            # 놓치므로 폴링 감시자로 대체 (중복 이벤트는 디바운서가 병합)
+            # Setup observer — native backends drop events on network mounts,
+            # so fall back to polling there (the debouncer coalesces duplicates)
+            if _is_network_mount(str(self.vault_path)):
+                self.observer = PollingObserver(timeout=2.0)
+                print("🌐 네트워크 파일시스템 감지 — 폴링 감시자 사용")
+                print("🌐 Network filesystem detected — using polling observer")
+            else:
+                self.observer = Observer()
             event_handler = VaultTreeEventHandler(self)
             self.observer.schedule(event_handler, str(self.vault_path), recursive=True)
             
@@ -458,13 +810,26 @@ python main.py stop-watch
         Returns:
             Dict: 상태 정보 / Status information
         """
+        # stat 한 번으로 존재 여부·크기·수정 시각을 모두 얻고, 짧은 TTL로
+        # 메모이즈하여 UI의 잦은 폴링이 시스템콜을 공유하게 함
+        # One stat yields existence, size and mtime; a short TTL memo lets
+        # rapid UI polling share a single syscall
+        now = time.monotonic()
+        if self._stat_cache is None or now - self._stat_cache[0] > 0.5:
+            try:
+                st = os.stat(self.tree_file)
+                file_info = (True, st.st_size,
+                             datetime.fromtimestamp(st.st_mtime).isoformat())
+            except FileNotFoundError:
+                file_info = (False, 0, None)
+            self._stat_cache = (now, file_info)
+
+        exists, size, last_modified = self._stat_cache[1]
         return {
             'is_watching': self.is_watching,
             'vault_path': str(self.vault_path),
             'tree_file': str(self.tree_file),
-            'tree_file_exists': self.tree_file.exists(),
-            'tree_file_size': self.tree_file.stat().st_size if self.tree_file.exists() else 0,
-            'last_modified': datetime.fromtimestamp(
-                self.tree_file.stat().st_mtime
-            ).isoformat() if self.tree_file.exists() else None
+            'tree_file_exists': exists,
+            'tree_file_size': size,
+            'last_modified': last_modified
         } 
\ No newline at end of file